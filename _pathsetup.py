@@ -0,0 +1,18 @@
+"""
+Put backend/ on sys.path for the top-level scripts.
+
+Import this module before any backend import:
+
+    import _pathsetup  # noqa: F401
+
+Python executes a module only once per process, so the path entry is
+added once however many scripts import it, and it is resolved from this
+file's location rather than the current working directory.
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
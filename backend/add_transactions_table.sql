@@ -1,5 +1,8 @@
 -- Add transactions table for transaction history
 -- This table stores all money transfers between users
+--
+-- Every foreign key column must keep its own index (idx_sender, idx_receiver);
+-- cascade checks on kodusers deletes otherwise scan this table once per row.
 
 CREATE TABLE IF NOT EXISTS transactions (
   id INT AUTO_INCREMENT PRIMARY KEY COMMENT 'Auto-increment transaction ID',
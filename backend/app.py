@@ -418,6 +418,17 @@ def transactions():
         }), 500
 
 
+@app.route('/api/health', methods=['GET'])
+def health():
+    """
+    Liveness probe.
+    
+    Does not touch the database, so it answers as soon as the app is
+    serving requests.
+    """
+    return jsonify({'status': 'ok'}), 200
+
+
 # Serve frontend files (only for local development)
 # In Vercel, frontend files are served directly by Vercel's CDN
 @app.route('/')
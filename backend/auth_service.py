@@ -11,6 +11,7 @@ Requirements: 1.1, 1.6, 2.1, 2.2, 2.4, 2.8
 
 import logging
 from datetime import datetime, timedelta
+from mysql.connector import IntegrityError
 from user_service import (
     create_user,
     get_user_by_username,
@@ -146,6 +147,27 @@ def register_user(uid, uname, password, email, phone):
         }
 
 
+def _reload_changed_user(username, cached_user):
+    """
+    Re-read a user whose cached record may be stale.
+    
+    The user cache is per process, so another gunicorn worker may have
+    deleted and re-registered the username since cached_user was read.
+    
+    Args:
+        username (str): Username to re-read
+        cached_user (dict): Record returned by the cached lookup
+    
+    Returns:
+        dict or None: The current record if it has another uid or password
+            hash than cached_user, otherwise None
+    """
+    user = get_user_by_username(username, refresh=True)
+    if user is None or (user['uid'], user['password']) == (cached_user['uid'], cached_user['password']):
+        return None
+    return user
+
+
 def login(username, password):
     """
     Authenticate user and generate JWT token.
@@ -190,14 +212,17 @@ def login(username, password):
                 'error_code': 'INVALID_CREDENTIALS'
             }
         
-        # Verify password hash
+        # Verify password hash; a mismatch may come from a stale cached
+        # record, so the current one gets a second chance
         if not verify_password(password, user['password']):
-            logger.warning(f"Login failed: invalid password for user - {username}")
-            return {
-                'success': False,
-                'message': 'Invalid credentials',
-                'error_code': 'INVALID_CREDENTIALS'
-            }
+            user = _reload_changed_user(username, user)
+            if user is None or not verify_password(password, user['password']):
+                logger.warning(f"Login failed: invalid password for user - {username}")
+                return {
+                    'success': False,
+                    'message': 'Invalid credentials',
+                    'error_code': 'INVALID_CREDENTIALS'
+                }
         
         # Generate JWT token with username as subject and role as claim
         # All users get "customer" role as per requirements
@@ -208,11 +233,28 @@ def login(username, password):
         expiry = datetime.utcnow() + timedelta(hours=JWT_EXPIRY_HOURS)
         
         # Store token in CJWT table
-        store_result = store_token(
-            token=token,
-            uid=user['uid'],
-            expiry=expiry
-        )
+        try:
+            store_result = store_token(
+                token=token,
+                uid=user['uid'],
+                expiry=expiry
+            )
+        except IntegrityError:
+            # A cached uid whose account has since been deleted fails the
+            # cjwt foreign key; retry once with the current record
+            user = _reload_changed_user(username, user)
+            if user is None or not verify_password(password, user['password']):
+                logger.warning(f"Login failed: account changed during login - {username}")
+                return {
+                    'success': False,
+                    'message': 'Invalid credentials',
+                    'error_code': 'INVALID_CREDENTIALS'
+                }
+            store_result = store_token(
+                token=token,
+                uid=user['uid'],
+                expiry=expiry
+            )
         
         if not store_result['success']:
             logger.error(f"Failed to store token for user: {username}")
@@ -7,9 +7,10 @@ with SSL support and error handling.
 
 import os
 import logging
+from contextlib import contextmanager
 from urllib.parse import urlparse, parse_qs
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import pooling, Error, HAVE_CEXT
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,6 +26,11 @@ logger = logging.getLogger(__name__)
 # Database connection pool
 _connection_pool = None
 
+# Connections per process, all opened at startup. Each gunicorn worker
+# holds its own pool, so a server needs workers * DB_POOL_SIZE connections
+# Override with KODBANK_DB_POOL_SIZE, clamped to [1, 32] (the connector's limit)
+DB_POOL_SIZE = min(max(int(os.getenv('KODBANK_DB_POOL_SIZE', '5')), 1), pooling.CNX_POOL_MAXSIZE)
+
 
 def parse_database_url(url):
     """
@@ -76,6 +82,8 @@ def initialize_connection_pool():
     
     This function should be called once during application startup.
     It creates a connection pool with SSL configuration as required.
+    All pool_size connections are opened up front, so later checkouts
+    skip the TCP/TLS/auth handshake.
     
     Raises:
         SystemExit: If connection pool initialization fails
@@ -97,11 +105,16 @@ def initialize_connection_pool():
         
         logger.info(f"Initializing connection pool for {db_config['host']}:{db_config['port']}")
         
+        # Prefer the C extension: it parses packets and converts rows in C
+        if not HAVE_CEXT:
+            logger.warning("mysql-connector C extension not available, using pure Python driver")
+        
         # Create connection pool
         _connection_pool = pooling.MySQLConnectionPool(
             pool_name="kodbank_pool",
-            pool_size=5,
+            pool_size=DB_POOL_SIZE,
             pool_reset_session=True,
+            use_pure=not HAVE_CEXT,
             **db_config
         )
         
@@ -124,6 +137,14 @@ def get_connection():
     """
     Get a connection from the pool.
     
+    The connection can be used as a context manager; leaving the block
+    returns it to the pool. Scripts issuing several statements should
+    hold one connection this way instead of calling execute_query repeatedly:
+    
+        with get_connection() as connection:
+            cursor = connection.cursor()
+            ...
+    
     Returns:
         mysql.connector.connection.MySQLConnection: Database connection
         
@@ -236,3 +257,66 @@ def execute_query(query, params=None, fetch=False):
             cursor.close()
         if connection:
             connection.close()
+
+
+@contextmanager
+def transaction():
+    """
+    Run several statements on one pooled connection inside a single transaction.
+    
+    Commits when the block exits normally and rolls back if an exception
+    escapes, so partial writes are never left behind.
+    
+    Yields:
+        cursor: Dictionary cursor bound to the transaction's connection
+        
+    Raises:
+        Error: If any statement fails
+    """
+    connection = get_connection()
+    cursor = None
+    
+    try:
+        connection.start_transaction()
+        cursor = connection.cursor(dictionary=True)
+        yield cursor
+        connection.commit()
+    except Error as e:
+        connection.rollback()
+        logger.error(f"Transaction error: {e}")
+        raise
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        if cursor:
+            cursor.close()
+        connection.close()
+
+
+def execute_many_in_txn(statements):
+    """
+    Execute several statements on one connection inside a single transaction.
+    
+    Args:
+        statements (list): SQL statements, each either a string or a
+            (query, params) tuple
+            
+    Returns:
+        list: Affected row count for each statement, in order
+        
+    Raises:
+        Error: If any statement fails (all changes are rolled back)
+    """
+    row_counts = []
+    
+    with transaction() as cursor:
+        for statement in statements:
+            if isinstance(statement, str):
+                query, params = statement, ()
+            else:
+                query, params = statement
+            cursor.execute(query, params or ())
+            row_counts.append(cursor.rowcount)
+    
+    return row_counts
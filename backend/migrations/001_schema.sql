@@ -0,0 +1,52 @@
+-- ============================================================================
+-- Migration 001: core schema for kodbank1
+-- ============================================================================
+--
+-- Creates the users, transactions and cjwt tables.
+-- Every statement is CREATE TABLE IF NOT EXISTS, so this file is safe to run
+-- on both fresh and existing databases; a second run changes nothing.
+--
+-- Applied by create_schema.py (and by reset_database.py after dropping tables).
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS users (
+    uid VARCHAR(50) PRIMARY KEY,
+    username VARCHAR(50) UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    email VARCHAR(100) UNIQUE NOT NULL,
+    phone VARCHAR(20) NOT NULL,
+    balance DECIMAL(15, 2) DEFAULT 0.00,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_username (username),
+    INDEX idx_email (email)
+);
+
+-- Invariant: every foreign key column MUST have its own index
+-- (idx_sender, idx_receiver here; idx_uid on cjwt). Without them, each
+-- deleted parent row forces a full scan of the child table for the
+-- cascade check.
+CREATE TABLE IF NOT EXISTS transactions (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    sender_username VARCHAR(50) NOT NULL,
+    receiver_username VARCHAR(50) NOT NULL,
+    amount DECIMAL(15, 2) NOT NULL,
+    transaction_type VARCHAR(20) NOT NULL DEFAULT 'transfer',
+    status VARCHAR(20) NOT NULL DEFAULT 'completed',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (sender_username) REFERENCES users(username) ON DELETE CASCADE,
+    FOREIGN KEY (receiver_username) REFERENCES users(username) ON DELETE CASCADE,
+    INDEX idx_sender (sender_username),
+    INDEX idx_receiver (receiver_username),
+    INDEX idx_created_at (created_at)
+);
+
+CREATE TABLE IF NOT EXISTS cjwt (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    token TEXT NOT NULL,
+    uid VARCHAR(50) NOT NULL,
+    expiry TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (uid) REFERENCES users(uid) ON DELETE CASCADE,
+    INDEX idx_uid (uid),
+    INDEX idx_expiry (expiry)
+);
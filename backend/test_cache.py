@@ -0,0 +1,159 @@
+"""
+Unit tests for the in-process TTL cache and its use in user_service.
+
+Tests cover:
+- Expiry and LRU eviction in TTLCache
+- get_user_by_username serving repeat lookups from cache
+- login re-reading a stale cached user before rejecting it
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+from mysql.connector import IntegrityError
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cache import TTLCache
+import user_service
+import auth_service
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+    
+    def test_get_and_set(self):
+        """Test stored values are returned until removed."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('missing'))
+        cache.pop('a')
+        self.assertIsNone(cache.get('a'))
+    
+    def test_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch('cache.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('cache.time.monotonic', return_value=129.0):
+            self.assertEqual(cache.get('a'), 1)
+        with patch('cache.time.monotonic', return_value=131.0):
+            self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+    
+    def test_remove_if(self):
+        """Test predicate-based removal."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(('h1', 'x'), True)
+        cache.set(('h2', 'y'), True)
+        cache.remove_if(lambda key: key[0] == 'h1')
+        self.assertIsNone(cache.get(('h1', 'x')))
+        self.assertTrue(cache.get(('h2', 'y')))
+
+
+class TestUserCache(unittest.TestCase):
+    """Test cases for cached user lookups."""
+    
+    def setUp(self):
+        user_service.clear_user_cache()
+    
+    @patch('user_service.execute_query')
+    def test_repeat_lookup_hits_cache(self, mock_execute):
+        """Test a second lookup does not query the database."""
+        mock_execute.return_value = [{'uid': 'u1', 'username': 'alice', 'password': 'hash'}]
+        
+        first = user_service.get_user_by_username('alice')
+        second = user_service.get_user_by_username('alice')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_execute.call_count, 1)
+        self.assertNotIn('balance', mock_execute.call_args[0][0])
+    
+    @patch('user_service.execute_query')
+    def test_missing_user_not_cached(self, mock_execute):
+        """Test unknown users are looked up again."""
+        mock_execute.return_value = []
+        
+        self.assertIsNone(user_service.get_user_by_username('ghost'))
+        self.assertIsNone(user_service.get_user_by_username('ghost'))
+        self.assertEqual(mock_execute.call_count, 2)
+
+
+
+OLD_USER = {'uid': 'u1', 'username': 'alice', 'password': 'old-hash'}
+NEW_USER = {'uid': 'u2', 'username': 'alice', 'password': 'new-hash'}
+
+
+@patch('auth_service.generate_token', MagicMock(return_value='token'))
+class TestLoginWithStaleUserCache(unittest.TestCase):
+    """Test login when another process re-registered a cached username."""
+    
+    def setUp(self):
+        user_service.clear_user_cache()
+        # Cache the old record, then let the database hold the new one
+        with patch('user_service.execute_query', return_value=[OLD_USER]):
+            user_service.get_user_by_username('alice')
+    
+    @patch('auth_service.store_token', return_value={'success': True})
+    @patch('user_service.execute_query', return_value=[NEW_USER])
+    def test_password_mismatch_rereads_user(self, mock_execute, mock_store):
+        """Test a new password is checked against the current record."""
+        with patch('auth_service.verify_password', side_effect=lambda pw, hashed: hashed == 'new-hash'):
+            result = auth_service.login('alice', 'new-password')
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['uid'], 'u2')
+        self.assertEqual(mock_execute.call_count, 1)
+    
+    @patch('user_service.execute_query', return_value=[OLD_USER])
+    def test_wrong_password_verified_once_when_unchanged(self, mock_execute):
+        """Test an unchanged record is not verified a second time."""
+        with patch('auth_service.verify_password', return_value=False) as mock_verify:
+            result = auth_service.login('alice', 'wrong-password')
+        
+        self.assertEqual(result['error_code'], 'INVALID_CREDENTIALS')
+        self.assertEqual(mock_verify.call_count, 1)
+    
+    @patch('auth_service.verify_password', return_value=True)
+    @patch('user_service.execute_query', return_value=[NEW_USER])
+    def test_stale_uid_retries_token_store(self, mock_execute, mock_verify):
+        """Test a cjwt foreign key failure retries with the current uid."""
+        def store(token, uid, expiry):
+            if uid == 'u1':
+                raise IntegrityError("foreign key constraint fails")
+            return {'success': True}
+        
+        with patch('auth_service.store_token', side_effect=store):
+            result = auth_service.login('alice', 'password')
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['uid'], 'u2')
+    
+    @patch('auth_service.verify_password', return_value=True)
+    @patch('user_service.execute_query', return_value=[])
+    def test_deleted_user_rejected(self, mock_execute, mock_verify):
+        """Test a cached user deleted since is rejected, not a server error."""
+        with patch('auth_service.store_token', side_effect=IntegrityError("foreign key constraint fails")):
+            result = auth_service.login('alice', 'password')
+        
+        self.assertEqual(result['error_code'], 'INVALID_CREDENTIALS')
+        self.assertIsNone(user_service._user_cache.get('alice'))
+
+
+if __name__ == '__main__':
+    unittest.main()
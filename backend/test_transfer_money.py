@@ -0,0 +1,115 @@
+"""
+Mock-based unit tests for transfer_money in user_service.
+
+Tests that transfers run inside a single database transaction:
+- Both rows are locked with one SELECT ... FOR UPDATE
+- Balances are updated in one statement and the transaction is recorded
+- Failed checks perform no writes
+"""
+
+import sys
+import os
+import unittest
+from contextlib import contextmanager
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from user_service import transfer_money
+
+
+def mock_transaction(rows):
+    """Build a transaction() replacement yielding a cursor that returns rows."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = rows
+    
+    @contextmanager
+    def _transaction():
+        yield cursor
+    
+    return _transaction, cursor
+
+
+class TestTransferMoneyMocked(unittest.TestCase):
+    """Test cases for transfer_money with a mocked transaction."""
+    
+    def test_successful_transfer(self):
+        """Test transfer locks, updates and records in one transaction."""
+        txn, cursor = mock_transaction([
+            {'username': 'alice', 'balance': Decimal('500.00')},
+            {'username': 'bob', 'balance': Decimal('100.00')}
+        ])
+        
+        with patch('user_service.transaction', txn):
+            result = transfer_money('alice', 'bob', 200)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['sender_balance'], 300.0)
+        self.assertEqual(result['receiver_balance'], 300.0)
+        
+        # SELECT FOR UPDATE, one UPDATE, one INSERT
+        self.assertEqual(cursor.execute.call_count, 3)
+        self.assertIn('FOR UPDATE', cursor.execute.call_args_list[0][0][0])
+        self.assertIn('UPDATE users', cursor.execute.call_args_list[1][0][0])
+        self.assertIn('balance - %s', cursor.execute.call_args_list[1][0][0])
+        self.assertIn(Decimal('200'), cursor.execute.call_args_list[1][0][1])
+        self.assertIn('INSERT INTO transactions', cursor.execute.call_args_list[2][0][0])
+    
+    def test_insufficient_balance(self):
+        """Test insufficient balance performs no writes."""
+        txn, cursor = mock_transaction([
+            {'username': 'alice', 'balance': Decimal('50.00')},
+            {'username': 'bob', 'balance': Decimal('100.00')}
+        ])
+        
+        with patch('user_service.transaction', txn):
+            result = transfer_money('alice', 'bob', 200)
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error_code'], 'INSUFFICIENT_BALANCE')
+        self.assertEqual(cursor.execute.call_count, 1)
+    
+    def test_receiver_not_found(self):
+        """Test missing receiver performs no writes."""
+        txn, cursor = mock_transaction([
+            {'username': 'alice', 'balance': Decimal('500.00')}
+        ])
+        
+        with patch('user_service.transaction', txn):
+            result = transfer_money('alice', 'bob', 200)
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error_code'], 'RECEIVER_NOT_FOUND')
+        self.assertEqual(cursor.execute.call_count, 1)
+    
+    def test_sender_not_found(self):
+        """Test missing sender performs no writes."""
+        txn, cursor = mock_transaction([
+            {'username': 'bob', 'balance': Decimal('100.00')}
+        ])
+        
+        with patch('user_service.transaction', txn):
+            result = transfer_money('alice', 'bob', 200)
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error_code'], 'SENDER_NOT_FOUND')
+        self.assertEqual(cursor.execute.call_count, 1)
+    
+    def test_self_transfer_ignores_case(self):
+        """Test a transfer to the same username in another case is rejected."""
+        txn, cursor = mock_transaction([
+            {'username': 'alice', 'balance': Decimal('500.00')}
+        ])
+        
+        with patch('user_service.transaction', txn):
+            result = transfer_money('alice', 'ALICE', 200)
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error_code'], 'INVALID_TRANSFER')
+        cursor.execute.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,8 @@ from user_service import (
     validate_phone,
     validate_username,
     validate_uid,
-    validate_password
+    validate_password,
+    BCRYPT_COST_FACTOR
 )
 
 
@@ -34,18 +35,23 @@ def test_validation_functions():
     assert validate_email("test@example.com") == True
     assert validate_email("invalid-email") == False
     assert validate_email("") == False
+    assert validate_email("a" * 250 + "@example.com") == False
     print("✓ Email validation works")
     
     # Test phone validation
     assert validate_phone("1234567890") == True
     assert validate_phone("+1 (555) 123-4567") == True
     assert validate_phone("123") == False
+    assert validate_phone("12345678901234567890123") == False
+    assert validate_phone("1234567890\n") == False
     print("✓ Phone validation works")
     
     # Test username validation
     assert validate_username("john_doe123") == True
     assert validate_username("user@name") == False
     assert validate_username("a" * 51) == False
+    assert validate_username("john\n") == False
+    assert validate_username("jöhn") == False
     print("✓ Username validation works")
     
     # Test UID validation
@@ -70,6 +76,10 @@ def test_password_hashing():
     hashed = hash_password(password)
     print(f"✓ Password hashed: {hashed[:20]}...")
     
+    # Verify configured cost factor is used
+    assert hashed.startswith(f"$2b${BCRYPT_COST_FACTOR:02d}$")
+    print(f"✓ Cost factor {BCRYPT_COST_FACTOR} applied")
+    
     # Verify correct password
     assert verify_password(password, hashed) == True
     print("✓ Correct password verification works")
@@ -78,6 +88,11 @@ def test_password_hashing():
     assert verify_password("wrongPassword", hashed) == False
     print("✓ Incorrect password rejection works")
     
+    # Verify cached verification still rejects wrong passwords
+    assert verify_password(password, hashed) == True
+    assert verify_password("wrongPassword", hashed) == False
+    print("✓ Cached verification works")
+    
     # Verify different hashes for same password
     hashed2 = hash_password(password)
     assert hashed != hashed2
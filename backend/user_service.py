@@ -10,17 +10,119 @@ This module provides user management functionality including:
 Requirements: 1.1, 1.4, 6.1, 6.2
 """
 
+import os
 import re
+import hashlib
 import logging
+import functools
+from decimal import Decimal
 import bcrypt
 from mysql.connector import Error, IntegrityError
-from db import execute_query
+from db import execute_query, transaction
+from cache import TTLCache
+
+# argon2-cffi is optional; only needed when KODBANK_PASSWORD_HASHER=argon2id
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:
+    PasswordHasher = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Bcrypt cost factor (work factor)
-BCRYPT_COST_FACTOR = 10
+# Override with KODBANK_BCRYPT_COST (e.g. 4 for test suites), clamped to [4, 15]
+BCRYPT_MIN_COST = 4
+BCRYPT_MAX_COST = 15
+BCRYPT_COST_FACTOR = min(max(int(os.getenv('KODBANK_BCRYPT_COST', '10')), BCRYPT_MIN_COST), BCRYPT_MAX_COST)
+
+# Salt generator bound to the configured cost (salt bytes are still random per call)
+_GENSALT = functools.partial(bcrypt.gensalt, rounds=BCRYPT_COST_FACTOR)
+
+# Hasher for new passwords: 'bcrypt' (default) or 'argon2id' (requires argon2-cffi)
+PASSWORD_HASHER = os.getenv('KODBANK_PASSWORD_HASHER', 'bcrypt').lower()
+_ARGON2 = PasswordHasher() if PasswordHasher is not None else None
+
+# Cache of successful password verifications, keyed by
+# (stored hash, sha256 of attempted password).
+# The plaintext is never stored; a changed password produces a new hash and misses.
+PASSWORD_CACHE_TTL_SECONDS = 900
+PASSWORD_CACHE_MAX_SIZE = 10000
+_password_cache = TTLCache(maxsize=PASSWORD_CACHE_MAX_SIZE, ttl=PASSWORD_CACHE_TTL_SECONDS)
+
+# Cache of user records by username. Balance is never cached since it
+# changes on every transfer; read it with get_balance() instead.
+# The cache is per process: under gunicorn a username deleted and
+# re-registered elsewhere can stay stale here for up to the TTL, so
+# auth_service.login re-reads the record before rejecting a login.
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 50000
+_user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# Basic email regex pattern
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Allowed characters for phone numbers: digits, spaces, hyphens, parentheses, plus sign
+_PHONE_CHARS = frozenset('0123456789 -()+')
+
+
+# SQL statements used by this module, built once at import
+_COUNT_USERS_BY_USERNAME_OR_EMAIL = "SELECT COUNT(*) as count FROM users WHERE username = %s OR email = %s"
+_COUNT_USERS_BY_USERNAME = "SELECT COUNT(*) as count FROM users WHERE username = %s"
+_COUNT_USERS_BY_EMAIL = "SELECT COUNT(*) as count FROM users WHERE email = %s"
+
+_INSERT_USER = """
+    INSERT INTO users (uid, username, email, password, balance, phone)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+_SELECT_USER_BY_USERNAME = """
+    SELECT uid, username, email, password, phone, created_at
+    FROM users
+    WHERE username = %s
+"""
+
+# CAST to DOUBLE so the driver returns a float directly instead of a Decimal
+_SELECT_BALANCE = "SELECT CAST(balance AS DOUBLE) AS balance FROM users WHERE username = %s"
+
+_LOCK_TRANSFER_BALANCES = """
+    SELECT username, balance
+    FROM users
+    WHERE username IN (%s, %s)
+    FOR UPDATE
+"""
+
+# Arithmetic runs in MySQL so balances keep DECIMAL precision end to end
+_UPDATE_TRANSFER_BALANCES = """
+    UPDATE users
+    SET balance = CASE username WHEN %s THEN balance - %s WHEN %s THEN balance + %s END
+    WHERE username IN (%s, %s)
+"""
+
+_INSERT_TRANSFER = """
+    INSERT INTO transactions (sender_username, receiver_username, amount, transaction_type, status)
+    VALUES (%s, %s, %s, 'transfer', 'completed')
+"""
+
+_SELECT_TRANSACTION_HISTORY = """
+    SELECT 
+        id,
+        sender_username,
+        receiver_username,
+        CAST(amount AS DOUBLE) AS amount,
+        transaction_type,
+        status,
+        created_at,
+        CASE 
+            WHEN sender_username = %s THEN 'sent'
+            ELSE 'received'
+        END as direction
+    FROM transactions
+    WHERE sender_username = %s OR receiver_username = %s
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
 
 
 def validate_email(email):
@@ -36,9 +138,11 @@ def validate_email(email):
     if not email or not isinstance(email, str):
         return False
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Bound the input before running the regex (RFC 5321 max is 254 characters)
+    if not 5 <= len(email) <= 254:
+        return False
+    
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_phone(phone):
@@ -56,8 +160,10 @@ def validate_phone(phone):
     
     # Allow digits, spaces, hyphens, parentheses, and plus sign
     # Length between 10 and 20 characters
-    pattern = r'^[\d\s\-\(\)\+]{10,20}$'
-    return re.match(pattern, phone) is not None
+    if not 10 <= len(phone) <= 20:
+        return False
+    
+    return all(c in _PHONE_CHARS for c in phone)
 
 
 def validate_username(username):
@@ -77,8 +183,12 @@ def validate_username(username):
     if len(username) > 50 or len(username) < 1:
         return False
     
-    pattern = r'^[a-zA-Z0-9_]+$'
-    return re.match(pattern, username) is not None
+    # str methods avoid the regex engine on this hot path
+    if not username.isascii():
+        return False
+    
+    stripped = username.replace('_', '')
+    return not stripped or stripped.isalnum()
 
 
 def validate_uid(uid):
@@ -115,15 +225,105 @@ def validate_password(password):
     return len(password) >= 6
 
 
+def _bcrypt_hash(password):
+    """Hash a password with bcrypt using the configured cost factor."""
+    return bcrypt.hashpw(password.encode('utf-8'), _GENSALT()).decode('utf-8')
+
+
+def _bcrypt_verify(plain_password, hashed_password):
+    """Verify a password against a bcrypt ($2a$/$2b$/$2y$) hash."""
+    return bcrypt.checkpw(
+        plain_password.encode('utf-8'),
+        hashed_password.encode('utf-8')
+    )
+
+
+def _argon2_hash(password):
+    """Hash a password with argon2id."""
+    return _ARGON2.hash(password)
+
+
+def _argon2_verify(plain_password, hashed_password):
+    """Verify a password against an argon2 hash."""
+    if _ARGON2 is None:
+        logger.error("argon2 hash found but argon2-cffi is not installed")
+        return False
+    
+    try:
+        return _ARGON2.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _resolve_hasher(name):
+    """
+    Resolve the password hashing function for new hashes.
+    
+    Falls back to bcrypt if the requested hasher is unknown or its
+    backend is not installed.
+    
+    Args:
+        name (str): Hasher name ('bcrypt' or 'argon2id')
+        
+    Returns:
+        callable: Function taking a plain password and returning a hash string
+    """
+    if name == 'argon2id':
+        if _ARGON2 is not None:
+            return _argon2_hash
+        logger.warning("argon2-cffi not installed, falling back to bcrypt for password hashing")
+    elif name != 'bcrypt':
+        logger.warning("Unknown password hasher '%s', falling back to bcrypt", name)
+    return _bcrypt_hash
+
+
+_HASHER = _resolve_hasher(PASSWORD_HASHER)
+
+
+def clear_password_cache(hashed_password=None):
+    """
+    Invalidate cached password verifications.
+    
+    Call this when a password is changed or a user is deleted.
+    
+    Args:
+        hashed_password (str, optional): Only drop entries for this stored hash.
+            If omitted, the whole cache is cleared.
+    """
+    if hashed_password is None:
+        _password_cache.clear()
+    else:
+        _password_cache.remove_if(lambda key: key[0] == hashed_password)
+
+
+def clear_user_cache(username=None):
+    """
+    Invalidate cached user records.
+    
+    Call this when a user's stored fields change or the user is deleted.
+    
+    Args:
+        username (str, optional): Only drop this user's entry.
+            If omitted, the whole cache is cleared.
+    """
+    if username is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(username)
+
+
 def hash_password(password):
     """
-    Hash a password using bcrypt with cost factor 10.
+    Hash a password using the configured hasher.
+    
+    Uses bcrypt with the configured cost factor (default 10) unless
+    KODBANK_PASSWORD_HASHER=argon2id and argon2-cffi is installed.
     
     Args:
         password (str): Plain text password to hash
         
     Returns:
-        str: Bcrypt hashed password
+        str: Hashed password
         
     Raises:
         ValueError: If password is invalid
@@ -131,32 +331,41 @@ def hash_password(password):
     if not validate_password(password):
         raise ValueError("Password must be at least 8 characters")
     
-    # Generate salt and hash password
-    salt = bcrypt.gensalt(rounds=BCRYPT_COST_FACTOR)
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    
     # Return as string for database storage
-    return hashed.decode('utf-8')
+    return _HASHER(password)
 
 
 def verify_password(plain_password, hashed_password):
     """
-    Verify a password against its bcrypt hash.
+    Verify a password against its stored hash.
+    
+    Dispatches on the hash prefix ($argon2 or bcrypt's $2a$/$2b$), so
+    existing bcrypt hashes keep working after switching hashers. Successful
+    verifications are cached for PASSWORD_CACHE_TTL_SECONDS; a cache miss
+    always falls through to the full hash check.
     
     Args:
         plain_password (str): Plain text password to verify
-        hashed_password (str): Bcrypt hashed password from database
+        hashed_password (str): Hashed password from database
         
     Returns:
         bool: True if password matches, False otherwise
     """
     try:
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
+        key = (hashed_password, hashlib.sha256(plain_password.encode('utf-8')).digest())
+        if _password_cache.get(key):
+            return True
+        
+        if hashed_password.startswith('$argon2'):
+            verified = _argon2_verify(plain_password, hashed_password)
+        else:
+            verified = _bcrypt_verify(plain_password, hashed_password)
+        
+        if verified:
+            _password_cache.set(key, True)
+        return verified
     except Exception as e:
-        logger.error(f"Password verification error: {e}")
+        logger.error("Password verification error: %s", e)
         return False
 
 
@@ -179,20 +388,20 @@ def user_exists(username=None, email=None):
     
     try:
         if username and email:
-            query = "SELECT COUNT(*) as count FROM users WHERE username = %s OR email = %s"
+            query = _COUNT_USERS_BY_USERNAME_OR_EMAIL
             params = (username, email)
         elif username:
-            query = "SELECT COUNT(*) as count FROM users WHERE username = %s"
+            query = _COUNT_USERS_BY_USERNAME
             params = (username,)
         else:
-            query = "SELECT COUNT(*) as count FROM users WHERE email = %s"
+            query = _COUNT_USERS_BY_EMAIL
             params = (email,)
         
         results = execute_query(query, params, fetch=True)
         return results[0]['count'] > 0
         
     except Error as e:
-        logger.error(f"Error checking user existence: {e}")
+        logger.error("Error checking user existence: %s", e)
         raise
 
 
@@ -231,54 +440,51 @@ def create_user(uid, username, password, email, phone, balance=1000002.00):
         raise ValueError("Invalid phone format: must be 10-20 characters")
     
     try:
-        # Check if user already exists
-        if user_exists(username=username, email=email):
-            return {
-                'success': False,
-                'message': 'Username or email already exists'
-            }
-        
         # Hash the password
         hashed_password = hash_password(password)
         
         # Insert user into database
-        query = """
-            INSERT INTO users (uid, username, email, password, balance, phone)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
         params = (uid, username, email, hashed_password, balance, phone)
         
-        execute_query(query, params, fetch=False)
+        # Duplicates are rejected by the UNIQUE constraints (IntegrityError below),
+        # so no pre-flight existence check is needed
+        execute_query(_INSERT_USER, params, fetch=False)
+        clear_user_cache(username)
         
-        logger.info(f"User created successfully: {username}")
+        logger.info("User created successfully: %s", username)
         return {
             'success': True,
             'message': 'User created successfully'
         }
         
     except IntegrityError as e:
-        logger.error(f"Integrity error creating user: {e}")
+        logger.error("Integrity error creating user: %s", e)
         return {
             'success': False,
             'message': 'Username or email already exists'
         }
     except Error as e:
-        logger.error(f"Database error creating user: {e}")
+        logger.error("Database error creating user: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating user: {e}")
+        logger.error("Unexpected error creating user: %s", e)
         raise
 
 
-def get_user_by_username(username):
+def get_user_by_username(username, refresh=False):
     """
     Retrieve a user record by username.
     
+    Results are cached for USER_CACHE_TTL_SECONDS. The record does not
+    include the balance; use get_balance() for that.
+    
     Args:
         username (str): Username to search for
+        refresh (bool): Skip the cached record and re-read the database
         
     Returns:
-        dict or None: User record dictionary if found, None otherwise
+        dict or None: User record dictionary (uid, username, email, password,
+            phone, created_at) if found, None otherwise
         
     Raises:
         ValueError: If username is invalid
@@ -286,22 +492,23 @@ def get_user_by_username(username):
     if not validate_username(username):
         raise ValueError("Invalid username format")
     
+    cached = None if refresh else _user_cache.get(username)
+    if cached is not None:
+        return dict(cached)
+    
     try:
-        query = """
-            SELECT uid, username, email, password, balance, phone, created_at
-            FROM users
-            WHERE username = %s
-        """
         params = (username,)
         
-        results = execute_query(query, params, fetch=True)
+        results = execute_query(_SELECT_USER_BY_USERNAME, params, fetch=True)
         
         if results:
-            return results[0]
+            _user_cache.set(username, results[0])
+            return dict(results[0])
+        _user_cache.pop(username)
         return None
         
     except Error as e:
-        logger.error(f"Error retrieving user by username: {e}")
+        logger.error("Error retrieving user by username: %s", e)
         raise
 
 
@@ -322,17 +529,16 @@ def get_balance(username):
         raise ValueError("Invalid username format")
     
     try:
-        query = "SELECT balance FROM users WHERE username = %s"
         params = (username,)
         
-        results = execute_query(query, params, fetch=True)
+        results = execute_query(_SELECT_BALANCE, params, fetch=True)
         
         if results:
-            return float(results[0]['balance'])
+            return results[0]['balance']
         return None
         
     except Error as e:
-        logger.error(f"Error retrieving balance: {e}")
+        logger.error("Error retrieving balance: %s", e)
         raise
 
 
@@ -340,11 +546,12 @@ def transfer_money(sender_username, receiver_username, amount):
     """
     Transfer money from sender to receiver.
     
-    This function performs a money transfer between two users:
-    1. Validates sender and receiver exist
-    2. Checks sender has sufficient balance
-    3. Deducts amount from sender
-    4. Adds amount to receiver
+    This function performs a money transfer between two users in a single
+    database transaction:
+    1. Locks sender and receiver rows (SELECT ... FOR UPDATE)
+    2. Validates sender and receiver exist
+    3. Checks sender has sufficient balance
+    4. Updates both balances and records the transaction
     
     Args:
         sender_username (str): Username of the sender
@@ -390,8 +597,9 @@ def transfer_money(sender_username, receiver_username, amount):
             'error_code': 'VALIDATION_ERROR'
         }
     
-    # Check if sender and receiver are the same
-    if sender_username == receiver_username:
+    # Check if sender and receiver are the same; usernames compare
+    # case-insensitively in MySQL, so 'alice' and 'ALICE' are one account
+    if sender_username.lower() == receiver_username.lower():
         return {
             'success': False,
             'message': 'Cannot transfer money to yourself',
@@ -399,78 +607,65 @@ def transfer_money(sender_username, receiver_username, amount):
         }
     
     try:
-        # Get sender details
-        sender = get_user_by_username(sender_username)
-        if not sender:
-            return {
-                'success': False,
-                'message': 'Sender account not found',
-                'error_code': 'SENDER_NOT_FOUND'
-            }
-        
-        # Get receiver details
-        receiver = get_user_by_username(receiver_username)
-        if not receiver:
-            return {
-                'success': False,
-                'message': 'Receiver account not found',
-                'error_code': 'RECEIVER_NOT_FOUND'
-            }
-        
-        # Check if sender has sufficient balance
-        sender_balance = float(sender['balance'])
-        if sender_balance < amount:
-            return {
-                'success': False,
-                'message': f'Insufficient balance. Available: {sender_balance}',
-                'error_code': 'INSUFFICIENT_BALANCE'
-            }
-        
-        # Calculate new balances
-        new_sender_balance = sender_balance - amount
-        new_receiver_balance = float(receiver['balance']) + amount
-        
-        # Update sender balance
-        update_sender_query = """
-            UPDATE users 
-            SET balance = %s 
-            WHERE username = %s
-        """
-        execute_query(update_sender_query, (new_sender_balance, sender_username), fetch=False)
-        
-        # Update receiver balance
-        update_receiver_query = """
-            UPDATE users 
-            SET balance = %s 
-            WHERE username = %s
-        """
-        execute_query(update_receiver_query, (new_receiver_balance, receiver_username), fetch=False)
-        
-        # Record transaction in transactions table
-        insert_transaction_query = """
-            INSERT INTO transactions (sender_username, receiver_username, amount, transaction_type, status)
-            VALUES (%s, %s, %s, 'transfer', 'completed')
-        """
-        execute_query(insert_transaction_query, (sender_username, receiver_username, amount), fetch=False)
-        
-        logger.info(f"Transfer successful: {sender_username} -> {receiver_username}, Amount: {amount}")
+        with transaction() as cursor:
+            # Lock both rows for the rest of the transaction in one round-trip
+            cursor.execute(_LOCK_TRANSFER_BALANCES, (sender_username, receiver_username))
+            # Key by lowercase to match MySQL's case-insensitive username collation
+            balances = {row['username'].lower(): row['balance'] for row in cursor.fetchall()}
+            sender_key = sender_username.lower()
+            receiver_key = receiver_username.lower()
+            
+            if sender_key not in balances:
+                return {
+                    'success': False,
+                    'message': 'Sender account not found',
+                    'error_code': 'SENDER_NOT_FOUND'
+                }
+            
+            if receiver_key not in balances:
+                return {
+                    'success': False,
+                    'message': 'Receiver account not found',
+                    'error_code': 'RECEIVER_NOT_FOUND'
+                }
+            
+            # Check if sender has sufficient balance (rows are locked, so this holds until commit)
+            decimal_amount = Decimal(str(amount))
+            if balances[sender_key] < decimal_amount:
+                return {
+                    'success': False,
+                    'message': f'Insufficient balance. Available: {balances[sender_key]}',
+                    'error_code': 'INSUFFICIENT_BALANCE'
+                }
+            
+            # Debit and credit relative to the stored balances in a single statement
+            cursor.execute(
+                _UPDATE_TRANSFER_BALANCES,
+                (sender_username, decimal_amount, receiver_username, decimal_amount,
+                 sender_username, receiver_username)
+            )
+            
+            # Record transaction in transactions table
+            cursor.execute(_INSERT_TRANSFER, (sender_username, receiver_username, amount))
+        
+        logger.info("Transfer successful: %s -> %s, Amount: %s", sender_username, receiver_username, amount)
         
         return {
             'success': True,
             'message': f'Successfully transferred {amount} to {receiver_username}',
-            'sender_balance': new_sender_balance,
-            'receiver_balance': new_receiver_balance
+            'sender_balance': float(balances[sender_key] - decimal_amount),
+            'receiver_balance': float(balances[receiver_key] + decimal_amount)
         }
         
     except Error as e:
-        logger.error(f"Database error during transfer: {e}")
+        logger.error("Database error during transfer: %s", e)
         return {
             'success': False,
             'message': 'Transfer failed due to database error',
             'error_code': 'DATABASE_ERROR'
         }
     except Exception as e:
-        logger.error(f"Unexpected error during transfer: {e}")
+        logger.error("Unexpected error during transfer: %s", e)
         return {
             'success': False,
             'message': 'Transfer failed due to unexpected error',
@@ -503,34 +698,11 @@ def get_transaction_history(username, limit=10):
         raise ValueError("Invalid username format")
     
     try:
-        query = """
-            SELECT 
-                id,
-                sender_username,
-                receiver_username,
-                amount,
-                transaction_type,
-                status,
-                created_at,
-                CASE 
-                    WHEN sender_username = %s THEN 'sent'
-                    ELSE 'received'
-                END as direction
-            FROM transactions
-            WHERE sender_username = %s OR receiver_username = %s
-            ORDER BY created_at DESC
-            LIMIT %s
-        """
         params = (username, username, username, limit)
         
-        results = execute_query(query, params, fetch=True)
-        
-        # Convert Decimal to float for JSON serialization
-        for transaction in results:
-            transaction['amount'] = float(transaction['amount'])
-        
-        return results
+        # amount is CAST to DOUBLE in SQL, so rows are already JSON-serializable
+        return execute_query(_SELECT_TRANSACTION_HISTORY, params, fetch=True)
         
     except Error as e:
-        logger.error(f"Error retrieving transaction history: {e}")
+        logger.error("Error retrieving transaction history: %s", e)
         raise
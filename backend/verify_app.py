@@ -30,26 +30,23 @@ print("\n=== Flask App Verification ===\n")
 # Check app is created
 print(f"✓ Flask app created: {app.name}")
 
-# Check routes are registered
-routes = []
-for rule in app.url_map.iter_rules():
-    if rule.endpoint != 'static':
-        routes.append({
-            'endpoint': rule.endpoint,
-            'methods': list(rule.methods - {'HEAD', 'OPTIONS'}),
-            'path': str(rule.rule)
-        })
+# Check routes are registered, indexed by path for direct lookup
+routes_by_path = {
+    rule.rule: rule
+    for rule in app.url_map.iter_rules()
+    if rule.endpoint != 'static'
+}
 
-print(f"✓ Routes registered: {len(routes)}")
+print(f"✓ Routes registered: {len(routes_by_path)}")
 
-for route in routes:
-    print(f"  - {route['methods']} {route['path']} -> {route['endpoint']}")
+for path, rule in routes_by_path.items():
+    print(f"  - {list(rule.methods - {'HEAD', 'OPTIONS'})} {path} -> {rule.endpoint}")
 
 # Verify /api/register endpoint exists
-register_route = next((r for r in routes if r['path'] == '/api/register'), None)
+register_route = routes_by_path.get('/api/register')
 if register_route:
     print(f"\n✓ /api/register endpoint found")
-    print(f"  - Methods: {register_route['methods']}")
+    print(f"  - Methods: {list(register_route.methods - {'HEAD', 'OPTIONS'})}")
     print(f"  - Accepts: POST requests")
     print(f"  - Expected request body: JSON with uid, uname, password, email, phone")
     print(f"  - Returns: JSON response with status and message")
@@ -21,37 +21,44 @@ def verify_login_endpoint():
     with open('backend/app.py', 'r') as f:
         app_code = f.read()
     
-    # Parse the code
+    # Lowercase once for the case-insensitive checks below
+    app_code_lower = app_code.lower()
+    
+    # Parse the code and index function definitions in a single walk
     tree = ast.parse(app_code)
+    functions = {
+        node.name: node
+        for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef)
+    }
     
     # Find the login endpoint function
-    login_endpoint_found = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == 'login_endpoint':
-            login_endpoint_found = True
-            print("\n✓ Login endpoint function 'login_endpoint' found")
-            
-            # Check docstring
-            docstring = ast.get_docstring(node)
-            if docstring and 'POST /api/login' in docstring:
-                print("✓ Endpoint docstring includes 'POST /api/login'")
-            
-            # Check for route decorator
-            for decorator in node.decorator_list:
-                if isinstance(decorator, ast.Call):
-                    if hasattr(decorator.func, 'attr') and decorator.func.attr == 'route':
-                        print("✓ @app.route decorator found")
-                        # Check route path
-                        if decorator.args and isinstance(decorator.args[0], ast.Constant):
-                            if decorator.args[0].value == '/api/login':
-                                print("✓ Route path is '/api/login'")
-                        # Check methods
-                        for keyword in decorator.keywords:
-                            if keyword.arg == 'methods':
-                                if isinstance(keyword.value, ast.List):
-                                    methods = [elt.value for elt in keyword.value.elts if isinstance(elt, ast.Constant)]
-                                    if 'POST' in methods:
-                                        print("✓ HTTP method 'POST' specified")
+    node = functions.get('login_endpoint')
+    login_endpoint_found = node is not None
+    if login_endpoint_found:
+        print("\n✓ Login endpoint function 'login_endpoint' found")
+        
+        # Check docstring
+        docstring = ast.get_docstring(node)
+        if docstring and 'POST /api/login' in docstring:
+            print("✓ Endpoint docstring includes 'POST /api/login'")
+        
+        # Check for route decorator
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call):
+                if hasattr(decorator.func, 'attr') and decorator.func.attr == 'route':
+                    print("✓ @app.route decorator found")
+                    # Check route path
+                    if decorator.args and isinstance(decorator.args[0], ast.Constant):
+                        if decorator.args[0].value == '/api/login':
+                            print("✓ Route path is '/api/login'")
+                    # Check methods
+                    for keyword in decorator.keywords:
+                        if keyword.arg == 'methods':
+                            if isinstance(keyword.value, ast.List):
+                                methods = [elt.value for elt in keyword.value.elts if isinstance(elt, ast.Constant)]
+                                if 'POST' in methods:
+                                    print("✓ HTTP method 'POST' specified")
     
     if not login_endpoint_found:
         print("\n✗ Login endpoint function not found!")
@@ -81,7 +88,7 @@ def verify_login_endpoint():
     ]
     
     for check_str, description in checks:
-        if check_str.lower() in app_code.lower():
+        if check_str.lower() in app_code_lower:
             print(f"✓ {description}: '{check_str}' found")
         else:
             print(f"✗ {description}: '{check_str}' NOT found")
@@ -2,10 +2,10 @@
 Script to delete ALL users from the database.
 WARNING: This will permanently delete all user accounts and their data!
 """
-import sys
-sys.path.insert(0, 'backend')
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
-from db import execute_query, initialize_connection_pool
+from db import execute_query, execute_many_in_txn, initialize_connection_pool
 
 # Initialize database connection
 print("Connecting to database...")
@@ -38,23 +38,17 @@ def clear_all_users():
             print("❌ Cancelled. No users were deleted.")
             return False
         
-        # Delete all transactions first (foreign key constraint)
-        print("\n🗑️  Deleting all transactions...")
-        query = "DELETE FROM transactions"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✓ Deleted {rows_affected} transactions")
-        
-        # Delete all JWT tokens
-        print("🗑️  Deleting all JWT tokens...")
-        query = "DELETE FROM cjwt"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✓ Deleted {rows_affected} JWT tokens")
-        
-        # Delete all users
-        print("🗑️  Deleting all users...")
-        query = "DELETE FROM users"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✅ Successfully deleted {rows_affected} users")
+        # Delete transactions first (foreign key constraint), then JWT tokens,
+        # then users - all in one transaction so a failure leaves nothing half-deleted
+        print("\n🗑️  Deleting all transactions, JWT tokens and users...")
+        transactions_deleted, tokens_deleted, users_deleted = execute_many_in_txn([
+            "DELETE FROM transactions",
+            "DELETE FROM cjwt",
+            "DELETE FROM users"
+        ])
+        print(f"✓ Deleted {transactions_deleted} transactions")
+        print(f"✓ Deleted {tokens_deleted} JWT tokens")
+        print(f"✅ Successfully deleted {users_deleted} users")
         print("✅ Database cleared successfully!")
         return True
             
@@ -71,12 +65,18 @@ def list_users():
         result = execute_query(query, fetch=True)
         
         if result and len(result) > 0:
-            print("\n=== Current Users ===")
-            print(f"{'UID':<10} {'Username':<20} {'Email':<30} {'Phone':<15} {'Balance':<10}")
-            print("-" * 90)
-            for user in result:
-                print(f"{user['uid']:<10} {user['username']:<20} {user['email']:<30} {user['phone']:<15} {user['balance']:<10.2f}")
-            print(f"\nTotal users: {len(result)}")
+            # Build the whole table and write it once instead of one print per row
+            lines = [
+                "\n=== Current Users ===",
+                f"{'UID':<10} {'Username':<20} {'Email':<30} {'Phone':<15} {'Balance':<10}",
+                "-" * 90
+            ]
+            lines.extend(
+                f"{user['uid']:<10} {user['username']:<20} {user['email']:<30} {user['phone']:<15} {user['balance']:<10.2f}"
+                for user in result
+            )
+            lines.append(f"\nTotal users: {len(result)}")
+            print("\n".join(lines))
         else:
             print("\n✓ No users in database")
             
@@ -2,24 +2,27 @@
 Script to delete a user from the database.
 Use this to clear existing users so you can re-register them.
 """
-import sys
-sys.path.insert(0, 'backend')
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
-from db import execute_query
+from db import execute_query, initialize_connection_pool
+
+# Initialize database connection
+initialize_connection_pool()
 
 def delete_user(username):
     """Delete a user by username."""
     try:
         # Delete from users table
         query = "DELETE FROM users WHERE username = %s"
-        result = execute_query(query, (username,), fetch=False)
+        rows_affected = execute_query(query, (username,), fetch=False)
         
-        if result['success']:
+        if rows_affected > 0:
             print(f"✓ Successfully deleted user: {username}")
-            print(f"  Rows affected: {result.get('rows_affected', 0)}")
+            print(f"  Rows affected: {rows_affected}")
             return True
         else:
-            print(f"✗ Failed to delete user: {result.get('error', 'Unknown error')}")
+            print(f"✗ No user found with username: {username}")
             return False
             
     except Exception as e:
@@ -32,13 +35,19 @@ def list_users():
         query = "SELECT uid, username, email, phone, balance FROM users"
         result = execute_query(query, fetch=True)
         
-        if result['success'] and result['data']:
-            print("\n=== Current Users ===")
-            print(f"{'UID':<10} {'Username':<20} {'Email':<30} {'Phone':<15} {'Balance':<10}")
-            print("-" * 90)
-            for user in result['data']:
-                print(f"{user['uid']:<10} {user['username']:<20} {user['email']:<30} {user['phone']:<15} {user['balance']:<10.2f}")
-            print(f"\nTotal users: {len(result['data'])}")
+        if result:
+            # Build the whole table and write it once instead of one print per row
+            lines = [
+                "\n=== Current Users ===",
+                f"{'UID':<10} {'Username':<20} {'Email':<30} {'Phone':<15} {'Balance':<10}",
+                "-" * 90
+            ]
+            lines.extend(
+                f"{user['uid']:<10} {user['username']:<20} {user['email']:<30} {user['phone']:<15} {user['balance']:<10.2f}"
+                for user in result
+            )
+            lines.append(f"\nTotal users: {len(result)}")
+            print("\n".join(lines))
         else:
             print("No users found or error occurred")
             
@@ -2,54 +2,76 @@
 Script to delete ALL users from the database WITHOUT confirmation.
 WARNING: This will permanently delete all user accounts and their data!
 """
-import sys
-sys.path.insert(0, 'backend')
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
-from db import execute_query, initialize_connection_pool
+from mysql.connector import Error
+from db import get_connection, initialize_connection_pool
+
+# Rows removed per DELETE when TRUNCATE is not permitted
+DELETE_CHUNK_SIZE = 100_000
 
 # Initialize database connection
 print("Connecting to database...")
 initialize_connection_pool()
 print("✓ Connected to database\n")
 
+def _delete_in_chunks(connection, cursor, table, chunk_size=DELETE_CHUNK_SIZE):
+    """
+    Delete all rows from a table in bounded batches.
+    
+    Each batch is committed separately so row locks and undo/binlog
+    size stay bounded instead of growing with the table.
+    
+    Returns:
+        int: Total number of rows deleted
+    """
+    total_deleted = 0
+    while True:
+        cursor.execute(f"DELETE FROM {table} LIMIT {chunk_size}")
+        deleted = cursor.rowcount
+        connection.commit()
+        total_deleted += deleted
+        if deleted < chunk_size:
+            return total_deleted
+
+
 def clear_all_users_now():
-    """Delete all users from the database without confirmation."""
+    """
+    Delete all users from the database without confirmation.
+    
+    Uses TRUNCATE TABLE, which recreates each table's storage instead of
+    logging every deleted row, so the cost does not grow with table size.
+    Falls back to chunked deletes if TRUNCATE is not permitted.
+    """
     try:
-        # First, show current users
-        query = "SELECT COUNT(*) as count FROM users"
-        result = execute_query(query, fetch=True)
-        
-        if result and len(result) > 0:
-            user_count = result[0]['count']
-            print(f"⚠️  Found {user_count} users in the database")
-        else:
-            print("✓ Database is already empty")
-            return True
-        
-        if user_count == 0:
-            print("✓ Database is already empty")
-            return True
-        
-        # Delete all transactions first (foreign key constraint)
-        print("\n🗑️  Deleting all transactions...")
-        query = "DELETE FROM transactions"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✓ Deleted {rows_affected} transactions")
-        
-        # Delete all JWT tokens
-        print("🗑️  Deleting all JWT tokens...")
-        query = "DELETE FROM cjwt"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✓ Deleted {rows_affected} JWT tokens")
+        with get_connection() as connection:
+            cursor = connection.cursor()
+            
+            # TRUNCATE refuses tables referenced by foreign keys unless checks are off
+            print("🗑️  Truncating transactions, JWT tokens and users...")
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            try:
+                for table in ('transactions', 'cjwt', 'users'):
+                    try:
+                        cursor.execute(f"TRUNCATE TABLE {table}")
+                        print(f"✓ Truncated {table}")
+                    except Error as e:
+                        print(f"⚠️  Could not truncate {table} ({e}), deleting in chunks")
+                        # The DELETE rowcount doubles as the emptiness check,
+                        # so no COUNT(*) probe is needed beforehand
+                        rows_deleted = _delete_in_chunks(connection, cursor, table)
+                        if rows_deleted == 0:
+                            print(f"ℹ️  {table} was already empty")
+                        else:
+                            print(f"✓ Deleted {rows_deleted} rows from {table}")
+            finally:
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+                cursor.close()
         
-        # Delete all users
-        print("🗑️  Deleting all users...")
-        query = "DELETE FROM users"
-        rows_affected = execute_query(query, fetch=False)
-        print(f"✅ Successfully deleted {rows_affected} users")
         print("✅ Database cleared successfully!")
         return True
-            
+    
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
@@ -69,20 +91,24 @@ if __name__ == '__main__':
     print("  VERIFICATION")
     print("=" * 60)
     
-    query = "SELECT COUNT(*) as count FROM users"
-    result = execute_query(query, fetch=True)
-    if result and len(result) > 0:
-        user_count = result[0]['count']
-        print(f"✓ Users remaining: {user_count}")
-    
-    query = "SELECT COUNT(*) as count FROM cjwt"
-    result = execute_query(query, fetch=True)
-    if result and len(result) > 0:
-        token_count = result[0]['count']
-        print(f"✓ JWT tokens remaining: {token_count}")
+    # Read row counts from table statistics instead of scanning each table
+    # with COUNT(*). ANALYZE TABLE refreshes the statistics (and MySQL 8's
+    # cached information_schema values) so the counts reflect the truncate.
+    with get_connection() as connection:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("ANALYZE TABLE users, cjwt, transactions")
+        cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT TABLE_NAME, TABLE_ROWS
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE()
+              AND TABLE_NAME IN ('users', 'cjwt', 'transactions')
+            """
+        )
+        counts = {row['TABLE_NAME']: row['TABLE_ROWS'] for row in cursor.fetchall()}
+        cursor.close()
     
-    query = "SELECT COUNT(*) as count FROM transactions"
-    result = execute_query(query, fetch=True)
-    if result and len(result) > 0:
-        transaction_count = result[0]['count']
-        print(f"✓ Transactions remaining: {transaction_count}")
+    print(f"✓ Users remaining: {counts.get('users')}")
+    print(f"✓ JWT tokens remaining: {counts.get('cjwt')}")
+    print(f"✓ Transactions remaining: {counts.get('transactions')}")
@@ -0,0 +1,67 @@
+"""
+Script to create the database schema from backend/migrations.
+Safe to run on fresh and existing databases - every table is created
+with CREATE TABLE IF NOT EXISTS, so a second run changes nothing.
+"""
+import os
+import re
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
+
+from db import get_connection, initialize_connection_pool
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend', 'migrations')
+SCHEMA_FILE = os.path.join(MIGRATIONS_DIR, '001_schema.sql')
+
+_TABLE_RE = re.compile(r'CREATE TABLE IF NOT EXISTS (\w+)')
+
+
+def load_statements(path=SCHEMA_FILE):
+    """
+    Read a migration file and split it into individual SQL statements.
+    
+    Comment lines starting with '--' are dropped.
+    
+    Returns:
+        list: SQL statements without trailing semicolons
+    """
+    with open(path, 'r') as f:
+        sql = "".join(line for line in f if not line.lstrip().startswith('--'))
+    return [statement.strip() for statement in sql.split(';') if statement.strip()]
+
+
+def create_schema():
+    """Create all tables that do not exist yet."""
+    try:
+        print("\n📝 Creating tables...")
+        
+        statements = load_statements()
+        
+        # MySQL commits DDL implicitly, so idempotency comes from IF NOT EXISTS
+        # rather than from wrapping the statements in a transaction.
+        # All statements go to the server in one round trip; the result
+        # iterator must be drained for every statement to run.
+        with get_connection() as connection:
+            cursor = connection.cursor()
+            for _ in cursor.execute(";\n".join(statements), multi=True):
+                pass
+            cursor.close()
+        
+        for statement in statements:
+            print(f"   ✓ Created {_TABLE_RE.search(statement).group(1)} table")
+        
+        print("✅ All tables created!")
+        return True
+    
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+if __name__ == '__main__':
+    # Initialize database connection
+    print("Connecting to database...")
+    initialize_connection_pool()
+    print("✓ Connected to database")
+    
+    create_schema()
@@ -1,90 +1,165 @@
 """
 Diagnostic script to identify registration issues.
+
+Each step imports only what it needs, so an early failure (for example
+missing environment variables) stops before the database, bcrypt and JWT
+modules are loaded.
+
+Results are collected into a single report and written to stdout as JSON
+once at the end, so the output can be parsed by CI or piped to jq.
 """
 import os
 import sys
+import json
+
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
+
+
+def check_env(section):
+    """
+    Check that the required environment variables are set.
+    
+    Args:
+        section (dict): Report section to fill in
+    
+    Returns:
+        bool: True if DATABASE_URL and JWT_SECRET_KEY are both set
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    db_url = os.getenv('DATABASE_URL')
+    jwt_secret = os.getenv('JWT_SECRET_KEY')
+    
+    section['DATABASE_URL'] = bool(db_url)
+    section['JWT_SECRET_KEY'] = bool(jwt_secret)
+    
+    if db_url and 'your_password_here' in db_url:
+        section['warning'] = "DATABASE_URL contains placeholder credentials; update .env with real AIVEN MySQL credentials"
+    
+    return bool(db_url and jwt_secret)
+
+
+def check_db(section):
+    """
+    Initialize the connection pool and run a test query.
+    
+    Args:
+        section (dict): Report section to fill in
+    
+    Returns:
+        bool: True if the database is reachable
+    """
+    try:
+        from db import test_connection, initialize_connection_pool
+        initialize_connection_pool()
+        section['connected'] = bool(test_connection())
+        if not section['connected']:
+            section['hint'] = "Check your DATABASE_URL in .env file"
+    except (Exception, SystemExit) as e:
+        # initialize_connection_pool raises SystemExit when the server is unreachable
+        section['connected'] = False
+        section['error'] = str(e)
+        section['hint'] = "This is likely why registration is failing"
+    return section['connected']
+
+
+def check_validators(section):
+    """
+    Run the user service validators against known-good input.
+    
+    Args:
+        section (dict): Report section to fill in
+    
+    Returns:
+        bool: True if every validator accepts its sample value
+    """
+    try:
+        from user_service import validate_email, validate_phone, validate_username
+        
+        section['email'] = validate_email("test@example.com")
+        section['phone'] = validate_phone("1234567890")
+        section['username'] = validate_username("testuser")
+        return all(section.values())
+    
+    except Exception as e:
+        section['error'] = str(e)
+        return False
 
-# Add backend to path
-sys.path.insert(0, 'backend')
-
-print("=" * 60)
-print("KODBANK1 REGISTRATION DIAGNOSTIC")
-print("=" * 60)
-
-# Check environment variables
-print("\n1. Checking environment variables...")
-from dotenv import load_dotenv
-load_dotenv()
-
-db_url = os.getenv('DATABASE_URL')
-jwt_secret = os.getenv('JWT_SECRET_KEY')
-
-print(f"   DATABASE_URL: {'✓ Set' if db_url else '✗ Missing'}")
-print(f"   JWT_SECRET_KEY: {'✓ Set' if jwt_secret else '✗ Missing'}")
-
-if db_url and 'your_password_here' in db_url:
-    print("   ⚠ WARNING: DATABASE_URL contains placeholder credentials!")
-    print("   Please update .env with real AIVEN MySQL credentials")
-
-# Check database connection
-print("\n2. Testing database connection...")
-try:
-    from db import test_connection, initialize_connection_pool
-    initialize_connection_pool()
-    if test_connection():
-        print("   ✓ Database connection successful")
-    else:
-        print("   ✗ Database connection failed")
-        print("   Please check your DATABASE_URL in .env file")
-except Exception as e:
-    print(f"   ✗ Database connection error: {e}")
-    print("   This is likely why registration is failing")
-
-# Test user service
-print("\n3. Testing user service...")
-try:
-    from user_service import validate_email, validate_phone, validate_username
-    
-    test_email = "test@example.com"
-    test_phone = "1234567890"
-    test_username = "testuser"
-    
-    print(f"   Email validation ({test_email}): {'✓' if validate_email(test_email) else '✗'}")
-    print(f"   Phone validation ({test_phone}): {'✓' if validate_phone(test_phone) else '✗'}")
-    print(f"   Username validation ({test_username}): {'✓' if validate_username(test_username) else '✗'}")
-    
-except Exception as e:
-    print(f"   ✗ User service error: {e}")
-
-# Test registration flow
-print("\n4. Testing registration flow...")
-try:
-    from auth_service import register_user
-    
-    test_data = {
-        'uid': 'TEST001',
-        'uname': 'diagtest',
-        'password': 'testpass123',
-        'email': 'diagtest@example.com',
-        'phone': '1234567890'
-    }
-    
-    print(f"   Attempting registration with test data...")
-    result = register_user(**test_data)
-    
-    if result['success']:
-        print(f"   ✓ Registration successful: {result['message']}")
-    else:
-        print(f"   ✗ Registration failed: {result['message']}")
-        print(f"   Error code: {result.get('error_code', 'N/A')}")
+
+def check_registration(section):
+    """
+    Attempt a full registration with fixed test data.
+    
+    Args:
+        section (dict): Report section to fill in
+    
+    Returns:
+        bool: True if the registration succeeded
+    """
+    try:
+        from auth_service import register_user
+        
+        test_data = {
+            'uid': 'TEST001',
+            'uname': 'diagtest',
+            'password': 'testpass123',
+            'email': 'diagtest@example.com',
+            'phone': '1234567890'
+        }
         
-except Exception as e:
-    print(f"   ✗ Registration error: {e}")
-    print(f"   Error type: {type(e).__name__}")
-    import traceback
-    print("\n   Full traceback:")
-    traceback.print_exc()
-
-print("\n" + "=" * 60)
-print("DIAGNOSTIC COMPLETE")
-print("=" * 60)
+        result = register_user(**test_data)
+        
+        section['success'] = result['success']
+        section['message'] = result['message']
+        if not result['success']:
+            section['error_code'] = result.get('error_code', 'N/A')
+        return result['success']
+    
+    except Exception as e:
+        import traceback
+        section['success'] = False
+        section['error'] = str(e)
+        section['error_type'] = type(e).__name__
+        section['traceback'] = traceback.format_exc()
+        return False
+
+
+# (report key, check, stop_on_failure) in run order; a hard failure skips the rest
+STEPS = [
+    ('env', check_env, True),
+    ('db', check_db, True),
+    ('validators', check_validators, False),
+    ('register', check_registration, False),
+]
+
+
+def main():
+    """
+    Run the diagnostic steps in order and write a JSON report.
+    
+    Returns:
+        bool: True if every step that ran succeeded
+    """
+    report = {}
+    success = True
+    stopped = False
+    
+    for key, check, stop_on_failure in STEPS:
+        section = report[key] = {}
+        if stopped:
+            section['skipped'] = True
+            continue
+        section['ok'] = ok = check(section)
+        if not ok:
+            success = False
+            stopped = stop_on_failure
+    
+    report['success'] = success
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+    return success
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,22 @@
+"""
+gunicorn settings for production mode, passed by run.py's exec_gunicorn.
+
+run.py's own logging setup does not survive the exec, so each worker
+calls run.setup_logging() right after it is forked. Workers then log at
+the production level to stdout through their own QueueListener.
+
+They do not open kodbank1.log: Python's RotatingFileHandler cannot be
+shared between processes, and concurrent rotations lose records.
+Collect stdout with the process supervisor (systemd, Docker, ...).
+"""
+import os
+import sys
+
+# Make run.py importable from the workers
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def post_fork(server, worker):
+    """Configure logging in a freshly forked worker."""
+    from run import setup_logging
+    setup_logging(log_file=False)
@@ -1,11 +1,17 @@
 """
 Script to completely reset the database - drops all tables and recreates them.
+Tables are recreated from backend/migrations/001_schema.sql (the same
+statements create_schema.py runs), in the same batch as the drops.
 WARNING: This will permanently delete ALL data!
 """
-import sys
-sys.path.insert(0, 'backend')
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
-from db import execute_query, initialize_connection_pool
+from db import get_connection, initialize_connection_pool
+from create_schema import load_statements
+
+# Dropped in this order; kodusers is a legacy table name
+TABLES = ['transactions', 'cjwt', 'kodusers', 'users']
 
 # Initialize database connection
 print("Connecting to database...")
@@ -27,105 +33,47 @@ def reset_database():
             print("❌ Cancelled.")
             return False
         
-        # Disable foreign key checks
-        print("\n🔧 Disabling foreign key checks...")
-        try:
-            execute_query("SET FOREIGN_KEY_CHECKS = 0", fetch=False)
-        except:
-            pass
-        
-        # Drop tables in correct order
-        tables = ['transactions', 'cjwt', 'kodusers', 'users']
-        
-        for table in tables:
-            print(f"🗑️  Dropping table: {table}")
-            try:
-                result = execute_query(f"DROP TABLE IF EXISTS {table}", fetch=False)
-                print(f"   ✓ Dropped {table}")
-            except Exception as e:
-                print(f"   ⚠️  Could not drop {table}: {e}")
-        
-        # Re-enable foreign key checks
-        print("\n🔧 Re-enabling foreign key checks...")
-        try:
-            execute_query("SET FOREIGN_KEY_CHECKS = 1", fetch=False)
-        except:
-            pass
-        
-        # Create tables
-        print("\n📝 Creating tables...")
-        
-        # Create users table
-        create_users = """
-        CREATE TABLE IF NOT EXISTS users (
-            uid VARCHAR(50) PRIMARY KEY,
-            username VARCHAR(50) UNIQUE NOT NULL,
-            password VARCHAR(255) NOT NULL,
-            email VARCHAR(100) UNIQUE NOT NULL,
-            phone VARCHAR(20) NOT NULL,
-            balance DECIMAL(15, 2) DEFAULT 0.00,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            INDEX idx_username (username),
-            INDEX idx_email (email)
-        )
-        """
-        result = execute_query(create_users, fetch=False)
-        try:
-            if result and result.get('success'):
-                print("   ✓ Created users table")
-            else:
-                print(f"   ✓ Created users table")
-        except:
-            print("   ✓ Created users table")
-        
-        # Create transactions table
-        create_transactions = """
-        CREATE TABLE IF NOT EXISTS transactions (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            sender_username VARCHAR(50) NOT NULL,
-            receiver_username VARCHAR(50) NOT NULL,
-            amount DECIMAL(15, 2) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (sender_username) REFERENCES users(username) ON DELETE CASCADE,
-            FOREIGN KEY (receiver_username) REFERENCES users(username) ON DELETE CASCADE,
-            INDEX idx_sender (sender_username),
-            INDEX idx_receiver (receiver_username),
-            INDEX idx_created_at (created_at)
-        )
-        """
-        result = execute_query(create_transactions, fetch=False)
-        try:
-            if result and result.get('success'):
-                print("   ✓ Created transactions table")
-            else:
-                print("   ✓ Created transactions table")
-        except:
-            print("   ✓ Created transactions table")
-        
-        # Create cjwt table
-        create_cjwt = """
-        CREATE TABLE IF NOT EXISTS cjwt (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            token TEXT NOT NULL,
-            uid VARCHAR(50) NOT NULL,
-            expiry TIMESTAMP NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (uid) REFERENCES users(uid) ON DELETE CASCADE,
-            INDEX idx_uid (uid),
-            INDEX idx_expiry (expiry)
-        )
-        """
-        result = execute_query(create_cjwt, fetch=False)
-        try:
-            if result and result.get('success'):
-                print("   ✓ Created cjwt table")
-            else:
-                print("   ✓ Created cjwt table")
-        except:
-            print("   ✓ Created cjwt table")
+        # SET FOREIGN_KEY_CHECKS is per-session, so everything runs on one
+        # pooled connection
+        with get_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            
+            # Foreign key constraints are dropped before the tables so the drops
+            # do not have to revalidate dependent keys across the schema. Only
+            # keys on the tables being reset are touched.
+            placeholders = ', '.join(['%s'] * len(TABLES))
+            cursor.execute(
+                f"""
+                SELECT CONSTRAINT_NAME, TABLE_NAME
+                FROM information_schema.TABLE_CONSTRAINTS
+                WHERE CONSTRAINT_SCHEMA = DATABASE() AND CONSTRAINT_TYPE = 'FOREIGN KEY'
+                  AND TABLE_NAME IN ({placeholders})
+                """,
+                TABLES
+            )
+            constraints = [(row['TABLE_NAME'], row['CONSTRAINT_NAME']) for row in cursor.fetchall()]
+            
+            # Build the whole reset as one script: one round trip instead of
+            # one per statement. The result iterator must be drained for every
+            # statement to run.
+            schema = load_statements()
+            script = ";\n".join([
+                "SET FOREIGN_KEY_CHECKS = 0",
+                *[f"ALTER TABLE `{table}` DROP FOREIGN KEY `{name}`" for table, name in constraints],
+                *[f"DROP TABLE IF EXISTS {table}" for table in TABLES],
+                *schema,
+                "SET FOREIGN_KEY_CHECKS = 1",
+            ])
+            
+            print(f"\n🔧 Dropping {len(constraints)} foreign key constraints and tables: {', '.join(TABLES)}")
+            print("📝 Recreating tables from backend/migrations...")
+            # If the batch stops part-way, FOREIGN_KEY_CHECKS is restored when
+            # the pool resets the session on return (pool_reset_session=True)
+            for _ in cursor.execute(script, multi=True):
+                pass
+            cursor.close()
         
         print("\n✅ Database reset successfully!")
-        print("✅ All tables created!")
         print("\n📊 You can now register new users.")
         return True
         
@@ -9,51 +9,148 @@ Requirements: 4.5
 
 import sys
 import os
+import queue
+import atexit
+import shutil
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-# Add backend directory to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
-from app import app
 from config import Config
+from db import DB_POOL_SIZE
+
+LOG_FILE = 'kodbank1.log'
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Threads per gunicorn worker; never more than the per-process DB pool
+# size, so a busy worker never finds the pool exhausted
+GUNICORN_THREADS = min(4, DB_POOL_SIZE)
+
+# Default worker cap. Every worker opens DB_POOL_SIZE connections, and
+# hosted MySQL plans often allow only a few dozen; WEB_CONCURRENCY overrides
+GUNICORN_MAX_DEFAULT_WORKERS = 4
+
+# Background log writer, stopped explicitly before exec'ing gunicorn
+log_listener = None
+
+# Sets up each gunicorn worker's stdout logging with setup_logging()
+GUNICORN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
 
 # Configure logging based on environment
-def setup_logging():
+def setup_logging(log_file=True):
     """
     Configure logging for the application based on environment.
     
     Development mode: INFO level with detailed format
     Production mode: WARNING level with structured format
+    
+    Request threads only enqueue records; a background QueueListener
+    thread writes them to stdout and, when log_file is set, a size-capped
+    rotating log file.
+    
+    Args:
+        log_file (bool): Also write LOG_FILE. Only a single process may
+            rotate it, so gunicorn workers pass False and log to stdout
     """
-    log_level = logging.DEBUG if Config.is_development() else logging.WARNING
+    # Evaluate the environment once; it also decides the startup message below
+    is_dev = Config.is_development()
+    log_level = logging.DEBUG if is_dev else logging.WARNING
     
-    # Configure root logger
+    global log_listener
+    # QueueHandler formats each record once before enqueueing it, so the
+    # listener's handlers keep the default message-only formatter
+    log_queue = queue.Queue(-1)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(
+            RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+        )
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    # Configure root logger; force replaces the stderr handler that
+    # backend/app.py's own basicConfig installed on import
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('kodbank1.log')
-        ]
+        handlers=[QueueHandler(log_queue)],
+        force=True
     )
     
     logger = logging.getLogger(__name__)
     
-    if Config.is_production():
-        logger.info("Running in PRODUCTION mode")
-        logger.info("Logging level: WARNING")
-    else:
+    if is_dev:
         logger.info("Running in DEVELOPMENT mode")
         logger.info("Logging level: DEBUG")
+    else:
+        logger.info("Running in PRODUCTION mode")
+        logger.info("Logging level: WARNING")
     
     return logger
 
 
+def exec_gunicorn(host, port, logger):
+    """
+    Replace this process with a gunicorn server running the app.
+    
+    Workers default to 2 * CPUs + 1, capped at GUNICORN_MAX_DEFAULT_WORKERS,
+    unless WEB_CONCURRENCY is set. The database needs workers *
+    DB_POOL_SIZE connections, which is logged at startup.
+    They log to stdout only (see gunicorn.conf.py); collect it with the
+    process supervisor.
+    Only returns if gunicorn is not installed or cannot be executed.
+    
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind
+        logger: Logger for startup messages
+    """
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn is None:
+        logger.warning("gunicorn not found - falling back to the Flask development server")
+        return
+    
+    default_workers = min(2 * (os.cpu_count() or 1) + 1, GUNICORN_MAX_DEFAULT_WORKERS)
+    workers = int(os.getenv('WEB_CONCURRENCY', default_workers))
+    logger.warning(
+        f"Starting gunicorn with {workers} workers on {host}:{port} "
+        f"({workers} x {DB_POOL_SIZE} = {workers * DB_POOL_SIZE} database connections)"
+    )
+    
+    # exec skips atexit handlers, so flush queued log records now. The
+    # atexit hook is dropped too: stopping a listener twice raises
+    atexit.unregister(log_listener.stop)
+    log_listener.stop()
+    
+    try:
+        os.execv(gunicorn, [
+            'gunicorn',
+            '-c', GUNICORN_CONFIG,
+            '--pythonpath', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'),
+            '-w', str(workers),
+            '-k', 'gthread',
+            '--threads', str(GUNICORN_THREADS),
+            '-b', f"{host}:{port}",
+            'app:app'
+        ])
+    except OSError as e:
+        # Still this process: resume logging before reporting the failure
+        log_listener.start()
+        atexit.register(log_listener.stop)
+        logger.error(f"Could not exec gunicorn ({e}) - falling back to the Flask development server")
+
+
 def main():
     """
     Main entry point for the application.
     
     Sets up logging, validates configuration, and starts the Flask server.
+    In production the server is gunicorn; otherwise the Flask development
+    server is used.
     """
     try:
         # Setup logging
@@ -73,6 +170,13 @@ def main():
         logger.info(f"Host: {flask_config['host']}")
         logger.info(f"Port: {flask_config['port']}")
         
+        if Config.is_production():
+            exec_gunicorn(flask_config['host'], flask_config['port'], logger)
+        
+        # Imported only for the development server: importing app opens a
+        # connection pool, which gunicorn's master must not hold before exec
+        from app import app
+        
         # Start Flask application
         app.run(
             host=flask_config['host'],
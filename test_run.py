@@ -3,24 +3,41 @@ Test script to verify run.py can be imported and configured correctly.
 """
 
 import sys
-import os
+import ast
+import pathlib
 
-# Add backend directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
 def test_run_imports():
     """Test that run.py can import all required modules."""
     try:
-        # Read run.py and check for required functions
-        with open('run.py', 'r') as f:
-            content = f.read()
+        # Parse run.py once and inspect the syntax tree
+        src = pathlib.Path(__file__).with_name('run.py').read_text()
+        tree = ast.parse(src)
+        nodes = list(ast.walk(tree))
+        
+        funcs = {n.name for n in nodes if isinstance(n, ast.FunctionDef)}
+        imports = {
+            (n.module, a.name)
+            for n in nodes if isinstance(n, ast.ImportFrom)
+            for a in n.names
+        }
+        has_main_guard = any(
+            isinstance(n, ast.If)
+            and isinstance(n.test, ast.Compare)
+            and isinstance(n.test.left, ast.Name) and n.test.left.id == '__name__'
+            and isinstance(n.test.comparators[0], ast.Constant)
+            and n.test.comparators[0].value == '__main__'
+            for n in tree.body
+        )
         
         # Check that the file has the expected functions
-        assert 'def setup_logging()' in content, "run.py should have setup_logging function"
-        assert 'def main()' in content, "run.py should have main function"
-        assert 'if __name__ == \'__main__\':' in content, "run.py should have main guard"
-        assert 'from app import app' in content, "run.py should import app"
-        assert 'from config import Config' in content, "run.py should import Config"
+        assert 'setup_logging' in funcs, "run.py should have setup_logging function"
+        assert 'main' in funcs, "run.py should have main function"
+        assert has_main_guard, "run.py should have main guard"
+        assert ('app', 'app') in imports, "run.py should import app"
+        assert ('config', 'Config') in imports, "run.py should import Config"
         
         print("✓ run.py structure is correct")
         print("✓ setup_logging function exists")
@@ -83,6 +100,52 @@ def test_logging_levels():
         return False
 
 
+def test_setup_logging_replaces_root_handlers():
+    """Test that setup_logging routes the root logger through its queue only."""
+    import os
+    import atexit
+    import logging
+    import tempfile
+    from logging.handlers import QueueHandler
+    
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    
+    # Import run without connecting to the database; both variables are
+    # restored afterwards so later tests see the original environment
+    skip_vars = ('SKIP_DB_INIT', 'SKIP_CONFIG_VALIDATION')
+    saved_env = {name: os.environ.get(name) for name in skip_vars}
+    try:
+        for name in skip_vars:
+            os.environ.setdefault(name, '1')
+        import run
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            saved_log_file = run.LOG_FILE
+            run.LOG_FILE = os.path.join(tmp, 'kodbank1.log')
+            try:
+                run.setup_logging()
+                handlers = root.handlers[:]
+            finally:
+                run.log_listener.stop()
+                atexit.unregister(run.log_listener.stop)
+                run.LOG_FILE = saved_log_file
+                root.handlers = saved_handlers
+                root.setLevel(saved_level)
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    
+    assert len(handlers) == 1, f"root logger should have one handler, got {handlers}"
+    assert isinstance(handlers[0], QueueHandler), "root logger should log through a QueueHandler"
+    
+    print("✓ Root logger uses only the QueueHandler")
+    return True
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Testing run.py Application Entry Point")
@@ -103,6 +166,10 @@ if __name__ == '__main__':
     results.append(test_logging_levels())
     print()
     
+    print("Test 4: Verify root logger handlers")
+    results.append(test_setup_logging_replaces_root_handlers())
+    print()
+    
     print("=" * 60)
     if all(results):
         print("✓ All tests passed!")
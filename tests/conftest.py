@@ -0,0 +1,113 @@
+"""
+Shared fixtures for the end-to-end API tests.
+
+These tests talk to a running kodbank1 server over HTTP (start it with
+`python run.py`) and are skipped when the server does not answer.
+
+Run them in parallel with pytest-xdist:
+
+    pytest tests -n auto --dist loadfile
+
+Each xdist worker builds its own session fixtures, so every worker
+registers its own uniquely named test user.
+"""
+
+import os
+import time
+import uuid
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.getenv('KODBANK_BASE_URL', 'http://localhost:5000')
+
+# Backoff delays (seconds) between liveness probes; ~3s in total
+HEALTH_CHECK_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+PASSWORD = 'TestPassword123!'
+
+
+def wait_for_server(session):
+    """
+    Poll /api/health with exponential backoff until the server answers.
+    
+    Returns:
+        bool: True if the server responded before the delays ran out
+    """
+    for delay in HEALTH_CHECK_DELAYS:
+        try:
+            session.get(f'{BASE_URL}/api/health', timeout=0.5)
+            return True
+        except requests.exceptions.RequestException:
+            time.sleep(delay)
+    return False
+
+
+def make_user():
+    """Build registration data with a unique username, uid and email."""
+    prefix = f'testuser_{uuid.uuid4().hex[:12]}'
+    return {
+        'uid': f'{prefix}_uid',
+        'uname': prefix,
+        'password': PASSWORD,
+        'email': f'{prefix}@test.com',
+        'phone': '+1234567890'
+    }
+
+
+@pytest.fixture(scope='session')
+def base_url():
+    """Root URL of the server under test (override with KODBANK_BASE_URL)."""
+    return BASE_URL
+
+
+@pytest.fixture
+def new_user():
+    """Registration data for a user that does not exist yet."""
+    return make_user()
+
+
+@pytest.fixture(scope='session')
+def http():
+    """
+    Anonymous HTTP session with pooled keep-alive connections.
+    
+    Skips the whole run if the server is not reachable.
+    """
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    if not wait_for_server(session):
+        pytest.skip(f"kodbank1 server is not running at {BASE_URL} (start it with: python run.py)")
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope='session')
+def test_user(http):
+    """Register one user shared by every test in this worker."""
+    user = make_user()
+    response = http.post(f'{BASE_URL}/api/register', json=user, timeout=10)
+    assert response.status_code == 200, response.text
+    return user
+
+
+@pytest.fixture
+def logged_in_session(test_user):
+    """
+    Fresh HTTP session holding a JWT for test_user.
+    
+    The server marks the jwt cookie Secure, which requests will not send
+    over plain http, so the token is copied onto the session explicitly.
+    """
+    session = requests.Session()
+    response = session.post(
+        f'{BASE_URL}/api/login',
+        json={'username': test_user['uname'], 'password': test_user['password']},
+        timeout=10
+    )
+    assert response.status_code == 200, response.text
+    session.cookies.clear()
+    session.cookies.set('jwt', response.cookies['jwt'])
+    yield session
+    session.close()
@@ -0,0 +1,19 @@
+"""
+End-to-end tests for GET /api/balance.
+"""
+
+
+def test_balance_with_token(logged_in_session, base_url):
+    response = logged_in_session.get(f'{base_url}/api/balance', timeout=10)
+    
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data['status'] == 'success'
+    assert 'balance' in data
+
+
+def test_balance_without_token(http, base_url):
+    response = http.get(f'{base_url}/api/balance', timeout=10)
+    
+    assert response.status_code == 401, response.text
+    assert response.json()['status'] == 'error'
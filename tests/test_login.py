@@ -0,0 +1,34 @@
+"""
+End-to-end tests for POST /api/login.
+"""
+
+import pytest
+
+
+def test_valid_login_sets_jwt_cookie(http, base_url, test_user):
+    response = http.post(
+        f'{base_url}/api/login',
+        json={'username': test_user['uname'], 'password': test_user['password']},
+        timeout=10
+    )
+    # Keep the shared session anonymous for the other tests
+    http.cookies.clear()
+    
+    assert response.status_code == 200, response.text
+    assert response.json()['status'] == 'success'
+    assert 'jwt' in response.cookies
+
+
+@pytest.mark.parametrize('username, password', [
+    (None, 'WrongPassword123!'),
+    ('nonexistent_user_12345', 'SomePassword123!'),
+], ids=['wrong_password', 'nonexistent_user'])
+def test_invalid_login_rejected(http, base_url, test_user, username, password):
+    response = http.post(
+        f'{base_url}/api/login',
+        json={'username': username or test_user['uname'], 'password': password},
+        timeout=10
+    )
+    
+    assert response.status_code == 401, response.text
+    assert response.json()['status'] == 'error'
@@ -0,0 +1,22 @@
+"""
+End-to-end tests for POST /api/register.
+"""
+
+import pytest
+
+
+def test_valid_registration(http, base_url, new_user):
+    response = http.post(f'{base_url}/api/register', json=new_user, timeout=10)
+    
+    assert response.status_code == 200, response.text
+    assert response.json()['status'] == 'success'
+
+
+@pytest.mark.parametrize('reused_field', ['uname', 'email'])
+def test_duplicate_registration_rejected(http, base_url, test_user, new_user, reused_field):
+    duplicate = dict(new_user, **{reused_field: test_user[reused_field]})
+    
+    response = http.post(f'{base_url}/api/register', json=duplicate, timeout=10)
+    
+    assert response.status_code in (400, 409), response.text
+    assert response.json()['status'] == 'error'
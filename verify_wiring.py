@@ -10,11 +10,21 @@ This script verifies that:
 Requirements: All
 """
 
+import io
 import sys
 import os
+import glob
+import json
+import hashlib
+import functools
+import importlib
+import importlib.metadata
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Add backend directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+# Put backend/ on sys.path
+import _pathsetup  # noqa: F401
 
 # ANSI color codes
 GREEN = '\033[92m'
@@ -23,23 +33,194 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# Steps running on worker threads print into a per-thread buffer that the
+# main thread writes out in step order, so output never interleaves
+_local = threading.local()
+
+def _stream():
+    """Return the current thread's output buffer, or stdout."""
+    return getattr(_local, 'buffer', sys.stdout)
+
+# Prebuilt ANSI fragments for the print helpers
+_BAR = BLUE + '=' * 60 + RESET + '\n'
+_OK = GREEN + '✓ '
+_FAIL = RED + '✗ '
+_INFO = YELLOW + 'ℹ '
+_END = RESET + '\n'
+
 def print_header(text):
     """Print a formatted header."""
-    print(f"\n{BLUE}{'=' * 60}{RESET}")
-    print(f"{BLUE}{text}{RESET}")
-    print(f"{BLUE}{'=' * 60}{RESET}\n")
+    _stream().write('\n' + _BAR + BLUE + text + _END + _BAR + '\n')
 
 def print_success(text):
     """Print success message."""
-    print(f"{GREEN}✓ {text}{RESET}")
+    _stream().write(_OK + text + _END)
 
 def print_error(text):
     """Print error message."""
-    print(f"{RED}✗ {text}{RESET}")
+    _stream().write(_FAIL + text + _END)
 
 def print_info(text):
     """Print info message."""
-    print(f"{YELLOW}ℹ {text}{RESET}")
+    _stream().write(_INFO + text + _END)
+
+
+# Imported modules, or the error raised importing them, shared by every step.
+# sys.modules already caches successful imports, but a module whose import
+# fails is dropped from it and would be re-executed (DB connect included)
+# by each later step.
+_mods = {}
+
+def _imp(name):
+    """
+    Import a module once per run.
+    
+    Raises:
+        Exception: The error from the first import attempt, if it failed
+    """
+    if name not in _mods:
+        try:
+            _mods[name] = importlib.import_module(name)
+        except Exception as e:
+            _mods[name] = e
+    module = _mods[name]
+    if isinstance(module, Exception):
+        raise module
+    return module
+
+
+def _app():
+    """Return the Flask app instance, shared by every step that inspects it."""
+    if 'app_instance' not in _mods:
+        _mods['app_instance'] = _imp('app').app
+    return _mods['app_instance']
+
+
+@functools.lru_cache(maxsize=1)
+def _config_snapshot():
+    """Collect every Config.get_*_config() result once per run."""
+    Config = _imp('config').Config
+    return {
+        'db': Config.get_database_config(),
+        'jwt': Config.get_jwt_config(),
+        'flask': Config.get_flask_config(),
+        'cors': Config.get_cors_config(),
+        'cookie': Config.get_cookie_config(),
+    }
+
+
+# Frontend files verify_frontend_files expects
+FRONTEND_FILES = (
+    'frontend/register.html',
+    'frontend/login.html',
+    'frontend/dashboard.html',
+    'frontend/js/register.js',
+    'frontend/js/login.js',
+    'frontend/js/dashboard.js',
+    'frontend/css/styles.css',
+)
+
+# Passing results of runs without a database are cached here, keyed by a hash
+# of every input they depend on
+CACHE_FILE = '.verify_cache.json'
+
+# Environment variables read by backend/config.py and app.py; secrets only
+# contribute their length to the cache key
+CONFIG_ENV_VARS = (
+    'ALLOWED_ORIGINS', 'COOKIE_SECURE', 'CORS_ORIGINS', 'FLASK_DEBUG', 'FLASK_ENV',
+    'FLASK_HOST', 'FLASK_PORT', 'JWT_EXPIRY_HOURS', 'SKIP_CONFIG_VALIDATION', 'SKIP_DB_INIT',
+)
+SECRET_ENV_VARS = ('DATABASE_URL', 'JWT_SECRET_KEY')
+
+
+def _installed_versions():
+    """
+    Look up the installed version of every package in requirements.txt.
+    
+    Returns:
+        list: (distribution, version) pairs; version is None if not installed
+    """
+    try:
+        with open('requirements.txt') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    
+    versions = []
+    for line in lines:
+        name = re.split(r'[\s<>=!~;\[]', line.split('#', 1)[0].strip(), maxsplit=1)[0]
+        if not name:
+            continue
+        try:
+            versions.append((name, importlib.metadata.version(name)))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append((name, None))
+    return versions
+
+
+def _cache_key():
+    """
+    Hash the inputs the verification results depend on.
+    
+    Covers this script, run.py, .env and backend/*.py contents, which frontend files
+    exist, the configuration environment variables, the interpreter, and the
+    installed versions of the requirements.txt packages (STEP 1 exists to catch
+    a broken environment, so a pass must not carry over to another one).
+    
+    Returns:
+        str: Hex digest identifying this set of inputs
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.executable}\0{sys.version}\0".encode())
+    for name, version in _installed_versions():
+        digest.update(f"{name}=={version}\0".encode())
+    for path in [__file__, 'run.py', '.env', *sorted(glob.glob('backend/*.py'))]:
+        digest.update(path.encode() + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+    for path in FRONTEND_FILES:
+        digest.update(f"{path}:{os.path.exists(path)}\0".encode())
+    for name in CONFIG_ENV_VARS:
+        digest.update(f"{name}={os.getenv(name)}\0".encode())
+    for name in SECRET_ENV_VARS:
+        digest.update(f"{name}:{len(os.getenv(name, ''))}\0".encode())
+    return digest.hexdigest()
+
+
+def _load_cached_results(key):
+    """
+    Return cached results if they were recorded for the same inputs.
+    
+    Returns:
+        dict: Step results, or None on a miss or unreadable cache
+    """
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached.get('results') if cached.get('key') == key else None
+
+
+def _save_results(key, results):
+    """Record results for these inputs; a failed write only costs a re-run."""
+    try:
+        with open(CACHE_FILE, 'w') as f:
+            json.dump({'key': key, 'results': results}, f, indent=2)
+    except OSError:
+        pass
+
+
+# Functions each service module must expose, checked by verify_services
+SERVICE_FUNCTIONS = (
+    ('auth_service', ('register_user', 'login', 'verify_token_from_request')),
+    ('user_service', ('get_balance', 'create_user', 'get_user_by_username')),
+    ('jwt_service', ('generate_token', 'validate_token', 'decode_token')),
+    ('db', ('initialize_connection_pool', 'get_connection', 'test_connection')),
+)
 
 
 def verify_imports():
@@ -59,7 +240,7 @@ def verify_imports():
     
     for module_name, description in modules_to_test:
         try:
-            __import__(module_name)
+            _imp(module_name)
             print_success(f"{description} imported successfully")
         except ImportError as e:
             print_error(f"Failed to import {description}: {e}")
@@ -76,7 +257,7 @@ def verify_flask_app():
     print_header("STEP 2: Verify Flask Application")
     
     try:
-        from app import app
+        app = _app()
         print_success("Flask app instance created successfully")
         
         # Check if CORS is configured
@@ -96,16 +277,13 @@ def verify_endpoints():
     print_header("STEP 3: Verify API Endpoints")
     
     try:
-        from app import app
+        app = _app()
         
-        # Get all registered routes
-        routes = []
+        # Index registered routes by (path, method) in a single pass
+        route_index = {}
         for rule in app.url_map.iter_rules():
-            routes.append({
-                'endpoint': rule.endpoint,
-                'methods': ','.join(sorted(rule.methods - {'HEAD', 'OPTIONS'})),
-                'path': str(rule)
-            })
+            for method in rule.methods - {'HEAD', 'OPTIONS'}:
+                route_index.setdefault((str(rule), method), rule)
         
         # Required endpoints
         required_endpoints = [
@@ -117,23 +295,18 @@ def verify_endpoints():
         all_found = True
         
         for required in required_endpoints:
-            found = False
-            for route in routes:
-                if route['path'] == required['path'] and required['methods'] in route['methods']:
-                    found = True
-                    print_success(f"{required['name']}: {required['methods']} {required['path']}")
-                    break
-            
-            if not found:
+            if (required['path'], required['methods']) in route_index:
+                print_success(f"{required['name']}: {required['methods']} {required['path']}")
+            else:
                 print_error(f"{required['name']} not found: {required['methods']} {required['path']}")
                 all_found = False
         
         # Check for frontend serving routes
-        frontend_routes = [r for r in routes if r['path'] in ['/', '/<path:path>']]
+        frontend_routes = [rule for rule in app.url_map.iter_rules() if str(rule) in ('/', '/<path:path>')]
         if frontend_routes:
             print_success("Frontend serving routes configured")
-            for route in frontend_routes:
-                print_info(f"  - {route['methods']} {route['path']}")
+            for rule in frontend_routes:
+                print_info(f"  - {','.join(sorted(rule.methods - {'HEAD', 'OPTIONS'}))} {rule}")
         else:
             print_info("Frontend serving routes not found (may need to be added)")
         
@@ -149,37 +322,17 @@ def verify_services():
     print_header("STEP 4: Verify Service Functions")
     
     try:
-        # Check auth_service functions
-        from auth_service import register_user, login, verify_token_from_request
-        print_success("auth_service functions available:")
-        print_info("  - register_user")
-        print_info("  - login")
-        print_info("  - verify_token_from_request")
-        
-        # Check user_service functions
-        from user_service import get_balance, create_user, get_user_by_username
-        print_success("user_service functions available:")
-        print_info("  - get_balance")
-        print_info("  - create_user")
-        print_info("  - get_user_by_username")
-        
-        # Check jwt_service functions
-        from jwt_service import generate_token, validate_token, decode_token
-        print_success("jwt_service functions available:")
-        print_info("  - generate_token")
-        print_info("  - validate_token")
-        print_info("  - decode_token")
-        
-        # Check db functions
-        from db import initialize_connection_pool, get_connection, test_connection
-        print_success("db functions available:")
-        print_info("  - initialize_connection_pool")
-        print_info("  - get_connection")
-        print_info("  - test_connection")
+        for module_name, function_names in SERVICE_FUNCTIONS:
+            module = _imp(module_name)
+            for function_name in function_names:
+                getattr(module, function_name)
+            print_success(f"{module_name} functions available:")
+            for function_name in function_names:
+                print_info(f"  - {function_name}")
         
         return True
         
-    except ImportError as e:
+    except (ImportError, AttributeError) as e:
         print_error(f"Failed to import service functions: {e}")
         return False
     except Exception as e:
@@ -192,13 +345,13 @@ def verify_configuration():
     print_header("STEP 5: Verify Configuration")
     
     try:
-        from config import Config
+        snapshot = _config_snapshot()
         
         # Check if environment variables are loaded
         print_info("Checking configuration...")
         
         # Check database URL
-        db_config = Config.get_database_config()
+        db_config = snapshot['db']
         if db_config.get('url'):
             print_success("Database URL configured")
             # Don't print the actual URL for security
@@ -207,7 +360,7 @@ def verify_configuration():
             print_error("Database URL not configured")
         
         # Check JWT config
-        jwt_config = Config.get_jwt_config()
+        jwt_config = snapshot['jwt']
         if jwt_config.get('secret_key'):
             print_success("JWT secret key configured")
             print_info(f"  - Key length: {len(jwt_config['secret_key'])} characters")
@@ -218,7 +371,7 @@ def verify_configuration():
         print_success(f"JWT algorithm: {jwt_config.get('algorithm')}")
         
         # Check Flask config
-        flask_config = Config.get_flask_config()
+        flask_config = snapshot['flask']
         print_success("Flask configuration loaded:")
         print_info(f"  - Environment: {flask_config.get('env')}")
         print_info(f"  - Debug: {flask_config.get('debug')}")
@@ -226,12 +379,12 @@ def verify_configuration():
         print_info(f"  - Port: {flask_config.get('port')}")
         
         # Check CORS config
-        cors_config = Config.get_cors_config()
+        cors_config = snapshot['cors']
         print_success("CORS configuration loaded:")
         print_info(f"  - Origins: {len(cors_config.get('origins', []))} configured")
         
         # Check cookie config
-        cookie_config = Config.get_cookie_config()
+        cookie_config = snapshot['cookie']
         print_success("Cookie configuration loaded:")
         print_info(f"  - Secure: {cookie_config.get('secure')}")
         print_info(f"  - HttpOnly: {cookie_config.get('httponly')}")
@@ -248,20 +401,22 @@ def verify_frontend_files():
     """Verify frontend files exist."""
     print_header("STEP 6: Verify Frontend Files")
     
-    frontend_files = [
-        'frontend/register.html',
-        'frontend/login.html',
-        'frontend/dashboard.html',
-        'frontend/js/register.js',
-        'frontend/js/login.js',
-        'frontend/js/dashboard.js',
-        'frontend/css/styles.css',
-    ]
+    frontend_files = FRONTEND_FILES
+    
+    # List each directory once instead of stat'ing every file
+    present = {}
+    for directory in {os.path.dirname(file_path) for file_path in frontend_files}:
+        try:
+            with os.scandir(directory) as entries:
+                present[directory] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present[directory] = set()
     
     all_exist = True
     
     for file_path in frontend_files:
-        if os.path.exists(file_path):
+        directory, name = os.path.split(file_path)
+        if name in present[directory]:
             print_success(f"{file_path} exists")
         else:
             print_error(f"{file_path} not found")
@@ -270,18 +425,91 @@ def verify_frontend_files():
     return all_exist
 
 
-def main():
-    """Run all verification checks."""
+# (result key, step, result key it depends on) in run order
+STEPS = (
+    ('imports', verify_imports, None),
+    ('flask_app', verify_flask_app, 'imports'),
+    ('endpoints', verify_endpoints, 'flask_app'),
+    ('services', verify_services, 'imports'),
+    ('configuration', verify_configuration, 'imports'),
+    ('frontend', verify_frontend_files, None),
+)
+
+# Steps other steps depend on run first, in order, on the main thread; the
+# rest are independent and run concurrently
+_PREREQUISITES = {requires for _, _, requires in STEPS if requires}
+
+
+def _skipped(name, requires):
+    """Report a step that was not run because its prerequisite failed."""
+    print_header(f"SKIPPED: {name.upper()}")
+    print_error(f"Skipped because {requires.upper()} failed")
+    return False
+
+
+def _run_buffered(step):
+    """
+    Run a step with its output captured.
+    
+    Returns:
+        tuple: (step result, captured output)
+    """
+    _local.buffer = io.StringIO()
+    try:
+        return step(), _local.buffer.getvalue()
+    finally:
+        del _local.buffer
+
+
+def run_checks():
+    """
+    Run every step in STEPS.
+    
+    Returns:
+        dict: Step name -> passed
+    """
+    results = {}
+    futures = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for name, step, requires in STEPS:
+            # Steps that depend on a failed step are marked failed without running
+            if requires and not results[requires]:
+                step = functools.partial(_skipped, name, requires)
+            if name in _PREREQUISITES:
+                results[name] = step()
+            else:
+                futures[name] = executor.submit(_run_buffered, step)
+        
+        for name, future in futures.items():
+            results[name], output = future.result()
+            sys.stdout.write(output)
+    
+    return results
+
+
+def main(argv=None):
+    """
+    Run all verification checks.
+    
+    A fully passing run with SKIP_DB_INIT set is cached in CACHE_FILE.
+    The next run with identical inputs prints the cached summary instead
+    of re-running the checks, unless --force is given.
+    """
+    argv = sys.argv[1:] if argv is None else argv
     print_header("KODBANK1 COMPONENT WIRING VERIFICATION - Task 14.1")
     
-    results = {
-        'imports': verify_imports(),
-        'flask_app': verify_flask_app(),
-        'endpoints': verify_endpoints(),
-        'services': verify_services(),
-        'configuration': verify_configuration(),
-        'frontend': verify_frontend_files(),
-    }
+    key = _cache_key()
+    results = None if '--force' in argv else _load_cached_results(key)
+    if results is not None:
+        print_info(f"Inputs unchanged since the last passing run; using {CACHE_FILE} (--force to re-run)")
+    else:
+        results = run_checks()
+        # Only passing runs are cached: a failure may come from something
+        # outside the hashed inputs and must be re-checked. Without
+        # SKIP_DB_INIT, importing app connects to the database, so a pass
+        # also depends on the database and is not cached either
+        if all(results.values()) and os.getenv('SKIP_DB_INIT'):
+            _save_results(key, results)
     
     # Summary
     print_header("VERIFICATION SUMMARY")